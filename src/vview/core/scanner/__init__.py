@@ -1,5 +1,8 @@
-from .interface import IVersionScanner
+from .interface import IVersionScanner, VersionRecord
+from .utils import version_pretty_str
 
 __all__ = [
     "IVersionScanner",
+    "VersionRecord",
+    "version_pretty_str",
 ]
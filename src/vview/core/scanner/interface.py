@@ -1,18 +1,52 @@
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, List, Optional, Tuple
 
-from vview.core.utils import elide_middle
+from vview.core.scanner.utils import version_pretty_str
 
 
-class IVersionScanner(ABC):
+@dataclass
+class VersionRecord:
+    """Everything displayed about a `version`, fetched at once
+
+    Attributes:
+        name:           Formatted name.
+        path:           Formatted path.
+        frames:         Formatted frames.
+        date:           Formatted date.
+        absolute_path:  Absolute path.
+        raw_path:       Path as scanned.
+        frame_range:    First and last frames. None for un-padded paths.
+    """
+
+    __slots__ = (
+        "name",
+        "path",
+        "frames",
+        "date",
+        "absolute_path",
+        "raw_path",
+        "frame_range",
+    )
+
+    name: str
+    path: str
+    frames: str
+    date: str
+    absolute_path: str
+    raw_path: str
+    frame_range: Optional[Tuple[int, int]]
+
+
+class IVersionScanner:
     """Version scanner interface
 
     Serves as a communication layer between the GUI and the scanning process.
     A `version' can be anything as long as its understood by the implementation.
     """
 
+    __slots__ = ()
+
     # Scan --------------------------------------------------------------------
-    @abstractmethod
     def scan_versions(self, path: str) -> List[Any]:
         """Scan for existing `versions` on disk
 
@@ -27,8 +61,20 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
+    def scan_versions_many(self, paths: List[str]) -> List[List[Any]]:
+        """Scan for existing `versions` of multiple paths
+
+        Implementations are free to scan the paths concurrently.
+
+        Args:
+            paths:  Paths of the files to scan.
+
+        Returns:
+            List of discovered `versions` for each path, in the same order
+        """
+        return [self.scan_versions(path) for path in paths]
+
     # Name --------------------------------------------------------------------
-    @abstractmethod
     def version_contains_name(self, version: Any) -> bool:
         """Check if the path contains a version sub-string
 
@@ -39,7 +85,6 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def version_raw_name(self, version: Any) -> Optional[str]:
         """Return the version name as scanned
 
@@ -52,7 +97,6 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def version_formatted_name(self, version: Any) -> str:
         """Return the name of a `version` for display purpose
 
@@ -62,7 +106,6 @@ class IVersionScanner(ABC):
         raise NotImplementedError
 
     # Path --------------------------------------------------------------------
-    @abstractmethod
     def version_raw_path(self, version: Any) -> str:
         """Return the path of a `version` as scanned
 
@@ -75,7 +118,6 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def version_formatted_path(self, version: Any) -> str:
         """Return the path of a `version` for display purpose
 
@@ -84,7 +126,6 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def version_absolute_path(self, version: Any) -> str:
         """Return the absolute path of a `version`
 
@@ -95,7 +136,6 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def path_replace_version_name(self, path: str, version_str: str) -> str:
         """Replace the version sub-strings in a path
 
@@ -111,7 +151,6 @@ class IVersionScanner(ABC):
         raise NotImplementedError
 
     # Frames ------------------------------------------------------------------
-    @abstractmethod
     def version_frame_range(self, version: Any) -> Optional[Tuple[int, int]]:
         """Return the frame range of a `version`
 
@@ -128,7 +167,6 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def version_formatted_frames(self, version: Any) -> str:
         """Return the frames of a `version` formatted as a string
 
@@ -140,7 +178,6 @@ class IVersionScanner(ABC):
         raise NotImplementedError
 
     # Date --------------------------------------------------------------------
-    @abstractmethod
     def version_formatted_date(self, version: Any) -> str:
         """Return the timestamp of a `version` formatted as a string
 
@@ -151,6 +188,25 @@ class IVersionScanner(ABC):
         """
         raise NotImplementedError
 
+    # Record ------------------------------------------------------------------
+    def version_record(self, version: Any) -> VersionRecord:
+        """Return everything displayed about a `version`
+
+        Implementations can override it to share the work of the individual methods.
+
+        Args:
+            version: Version to inspect
+        """
+        return VersionRecord(
+            name=self.version_formatted_name(version),
+            path=self.version_formatted_path(version),
+            frames=self.version_formatted_frames(version),
+            date=self.version_formatted_date(version),
+            absolute_path=self.version_absolute_path(version),
+            raw_path=self.version_raw_path(version),
+            frame_range=self.version_frame_range(version),
+        )
+
     # Print -------------------------------------------------------------------
     def version_pretty_str(self, version: Any, max_len: int = 90) -> str:
         """Return a pretty string of the `version`
@@ -159,22 +215,4 @@ class IVersionScanner(ABC):
             version:    Version to render.
             max_len:    Maximum string width.
         """
-        if version is None:
-            return str(None)
-
-        name = self.version_formatted_name(version)
-        dead_space = 15
-        suffix_len = max_len - dead_space - len(name)
-
-        frames = self.version_formatted_frames(version)
-        frames = elide_middle(frames, suffix_len).ljust(suffix_len)
-        path = self.version_formatted_path(version)
-        path = elide_middle(path, suffix_len).ljust(suffix_len)
-        date = self.version_formatted_date(version)
-        date = elide_middle(date, suffix_len).ljust(suffix_len)
-
-        txt = ""
-        txt += f'| {" " * len(name)} | frames: {frames} |\n'
-        txt += f"| {name} |   path: {path} |\n"
-        txt += f'| {" " * len(name)} |   date: {date} |'
-        return txt
+        return version_pretty_str(self, version, max_len=max_len)
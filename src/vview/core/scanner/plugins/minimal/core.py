@@ -1,30 +1,119 @@
+import functools
 import os
-import glob
 import re
-from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+from vview.core.utils import format_frames
 
-VERS_RE = re.compile(r"[vV](\d+)")
+# Optional linear-time regex engine for the default patterns.
+# Set the `VVIEW_NO_RE2` environment variable to force the standard library engine.
+_re = re
+if not os.environ.get("VVIEW_NO_RE2"):
+    try:
+        import re2 as _re
+    except ModuleNotFoundError:
+        pass
+
+
+VERS_RE = _re.compile(r"[vV](\d+)")
 # Regex pattern for versions
 # The first capture group is required and is used to get the version number as an integer.
 # version ex: V1, v1, v01, v001, ...
-HASH_RE = re.compile(r"#{2,}")
+HASH_RE = _re.compile(r"#{2,}")
 # Regex pattern for hash frame padding
 # Currently only match with a minimum of 2 '#' to limit possible conflicts.
 # padding ex: ##, ####, ########, ...
-STRF_RE = re.compile(r"%0(\d)d")
+STRF_RE = _re.compile(r"%0(\d)d")
 # Regex pattern for string format frame padding
 # The first capture group is required and is used to capture the size as an integer.
 # padding ex: %02d, %04d, %08d, ...
-VersionType = Tuple[str, Optional[str], List[str]]
-# VersionType = (padded_path, version_str, frames)
-#
-# padded_path (str):        Padded files path.
-# version_str (str | None): Full version string.
-#                           None if no version could be found.
-# frames (List[str]):       List of discovered frame strings.
-#                           Always empty for un-padded paths.
+_DEFAULT_VERSION_PATTERNS = (VERS_RE,)
+_DEFAULT_PADDING_PATTERNS = (STRF_RE, HASH_RE)
+# Patterns used when none are provided, in order of priority
+_PATTERN_CHARS = {VERS_RE: ("v", "V"), HASH_RE: ("#",), STRF_RE: ("%",)}
+# One of these characters must be in a path for the default pattern to match.
+# A substring test is much cheaper than walking the path with the regex.
+
+
+@dataclass
+class Version:
+    """Version discovered on disk
+
+    Attributes:
+        padded_path:    Padded files path.
+        version_str:    Full version string.
+                        None if no version could be found.
+        frames:         List of discovered frame strings.
+                        Always empty for un-padded paths.
+        mtime:          Modification time of the last file, captured while scanning.
+                        None if it could not be read.
+    """
+
+    __slots__ = (
+        "padded_path",
+        "version_str",
+        "frames",
+        "mtime",
+        "_int_frames",
+        "_formatted_frames",
+    )
+
+    padded_path: str
+    version_str: Optional[str]
+    frames: List[str]
+    mtime: Optional[float]
+
+    def __post_init__(self) -> None:
+        self._int_frames = None
+        self._formatted_frames = None
+
+    @property
+    def int_frames(self) -> List[int]:
+        """Frames converted to integers, computed on first access"""
+        if self._int_frames is None:
+            self._int_frames = list(map(int, self.frames))
+        return self._int_frames
+
+    @property
+    def frame_range(self) -> Optional[Tuple[int, int]]:
+        """First and last frames. None for un-padded paths"""
+        int_frames = self.int_frames
+        if int_frames:
+            return int_frames[0], int_frames[-1]
+        return None
+
+    @property
+    def formatted_frames(self) -> str:
+        """Frames formatted as a string, computed on first access
+
+        ex: '1-5, 7, 9-10'
+        """
+        if self._formatted_frames is None:
+            self._formatted_frames = format_frames(self.int_frames, sep=", ")
+        return self._formatted_frames
+
+    def to_tuple(self) -> Tuple[str, Optional[str], List[str], Optional[float]]:
+        """Return the version as a (padded_path, version_str, frames, mtime) tuple"""
+        return self.padded_path, self.version_str, self.frames, self.mtime
+
+    def copy(self) -> "Version":
+        """Return a copy sharing no mutable state, with the values already computed"""
+        version = Version(
+            self.padded_path, self.version_str, list(self.frames), self.mtime
+        )
+        if self._int_frames is not None:
+            version._int_frames = list(self._int_frames)
+        version._formatted_frames = self._formatted_frames
+        return version
+
+
+VersionType = Version
+# Alias kept for annotations written against the former tuple type
+
+
+_SEPARATORS = tuple(sep for sep in (os.sep, os.altsep) if sep)
 
 
 # Version ---------------------------------------------------------------------
@@ -40,34 +129,31 @@ def re_match_versions(path: str, pattern: re.Pattern = VERS_RE) -> List[re.Match
     Returns:
         Ordered list of Match objects
     """
-    matches = list(pattern.finditer(path))
-    if not matches:
-        return []
+    return list(_re_match_versions(path, pattern))
 
-    last_str = matches[-1].group(0)
-    return [i for i in matches if i.group(0) == last_str]
 
+@functools.lru_cache(maxsize=1024)
+def _re_match_versions(path: str, pattern: re.Pattern) -> Tuple[re.Match, ...]:
+    """Cached implementation of `re_match_versions`"""
+    if not _may_match(path, pattern):
+        return ()
 
-def replace_version_by_glob(path: str, m: re.Match, offset: int = 0) -> str:
-    """Replace a verion sub-string with a glob pattern
+    matches = tuple(pattern.finditer(path))
+    if not matches:
+        return ()
 
-    The glob pattern is used to discover versions on disk
-    ex: 'v01' -> 'v[0-9][0-9]'
+    last_str = matches[-1].group(0)
+    return tuple(i for i in matches if i.group(0) == last_str)
 
-    Args:
-        path:   Path to operate on.
-        m:      Captured version.
-                The Match object mush have a group(1) that
-                captures the number part of the version string.
-        offset: Moves the replace operation left/right of the Match.
-                Useful when doing multiple substitutions in chain that can
-                each alter the string length.
-    """
-    padding = "[0-9]" * len(m.group(1))
-    return replace_re_match(path, padding, m, group=1, offset=offset)
+
+def _may_match(path: str, pattern: re.Pattern) -> bool:
+    """Return False if a default pattern cannot match anywhere in the path"""
+    chars = _PATTERN_CHARS.get(pattern)
+    return chars is None or any(c in path for c in chars)
 
 
 # Padding ---------------------------------------------------------------------
+@functools.lru_cache(maxsize=1024)
 def re_match_padding(
     path: str,
     pattern: re.Pattern,
@@ -81,35 +167,15 @@ def re_match_padding(
         fullpath:   True will scan the whole path.
                     False will only scan the filename.
     """
-    root_len = len(str(Path(path).parent))
-    for m in reversed(list(pattern.finditer(path))):
-        if fullpath or m.start(0) >= root_len:
-            return m
-
-
-def replace_padding_by_glob(path: str, m: re.Match, offset: int = 0) -> str:
-    """Replace a frame padding sub-strings with a glob pattern
+    if not _may_match(path, pattern):
+        return None
 
-    The glob pattern is used to discover versions on disk
-    ex: 'file_####.exr' -> 'file_[0-9][0-9][0-9][0-9].exr'
-    ex: 'file_%02d.exr' -> 'file_[0-9][0-9].exr'
-
-    Args:
-        path:   Path to operate on.
-        m:      Captured frame padding.
-                If a group(1) exist, its value will be converted to integer and
-                used to determine the size of the padding.
-                Useful with `%02d` notation.
-        offset: Moves the replace operation left/right of the Match.
-                Useful when doing multiple substitutions in chain that can
-                each alter the string length.
-    """
-    try:
-        size = int(m.group(1))
-    except IndexError:
-        size = len(m.group(0))
-    padding = "[0-9]" * size
-    return replace_re_match(path, padding, m, offset=offset)
+    # Only the last match is kept
+    last = None
+    pos = 0 if fullpath else len(_split_basename(path)[0])
+    for m in pattern.finditer(path, pos):
+        last = m
+    return last
 
 
 # Scanning --------------------------------------------------------------------
@@ -118,7 +184,7 @@ def scan_versions(
     root_dir: Optional[str] = None,
     version_patterns: Optional[Iterable[re.Pattern]] = None,
     padding_patterns: Optional[Iterable[re.Pattern]] = None,
-) -> List[VersionType]:
+) -> List[Version]:
     """Scan for related versions that exist on disk if any.
 
     Args:
@@ -137,20 +203,22 @@ def scan_versions(
                             which has a different string length than the padding.
 
     Returns:
-        Ordered list of versions discovered. Each version is a VersionType.
+        Ordered list of versions discovered. Each version is a Version.
 
         padded_path:    Original path with the version string replaced.
         version_str:    Full version string.
                         None if no version could be found.
         frames:         List of discovered frame strings.
                         Always empty for un-padded paths.
+        mtime:          Modification time of the last file.
+                        None if it could not be read.
     """
     if not path:
         return []
-    version_patterns = [VERS_RE] if version_patterns is None else version_patterns
-    padding_patterns = (
-        [STRF_RE, HASH_RE] if padding_patterns is None else padding_patterns
-    )
+    if version_patterns is None:
+        version_patterns = _DEFAULT_VERSION_PATTERNS
+    if padding_patterns is None:
+        padding_patterns = _DEFAULT_PADDING_PATTERNS
 
     # Find version sub-string matches
     version_matches = []
@@ -166,60 +234,288 @@ def scan_versions(
         if padding_match:
             break
 
-    # Sort substitutions from back to front as to not disrupt operations
-    match_tuples = [("version", m) for m in version_matches]
-    if padding_match:
-        match_tuples.append(("padding", padding_match))
-    match_tuples.sort(key=lambda i: i[1].start(0), reverse=True)
+    # Plain path: it is its own and only version
+    if not version_matches and not padding_match:
+        return _scan_plain_path(path, root_dir)
 
-    # Substitute version/padding for glob expressions.
-    glob_expr = path
-    for type_name, m in match_tuples:
-        if type_name == "version":
-            glob_expr = replace_version_by_glob(glob_expr, m)
-        elif type_name == "padding":
-            glob_expr = replace_padding_by_glob(glob_expr, m)
+    # Digit spans to substitute, from front to back
+    if len(version_matches) == 1 and padding_match:
+        # Most common shape: a single version and a frame padding
+        spans = (_version_span(version_matches[0]), _padding_span(padding_match))
+        if spans[0] > spans[1]:
+            spans = spans[::-1]
+    else:
+        spans = [_version_span(m) for m in version_matches]
+        if padding_match:
+            spans.append(_padding_span(padding_match))
+        spans = tuple(sorted(spans))
 
     # Scan existing files
-    if root_dir:
-        with WorkingDirectory(root_dir):
-            files = sorted(glob.glob(glob_expr))
-    else:
-        files = sorted(glob.glob(glob_expr))
+    files = _list_files(path, spans, root_dir)
 
     # Group by version
-    version_groups = dict()
-    for file in files:
-        v_str_list = _get_path_version_strings(file, version_matches, padding_match)
-        # Discard files where version strings are not all equal
-        if len(set(v_str_list)) <= 1:
-            version_str = v_str_list[-1] if v_str_list else None
-            if version_str in version_groups.keys():
-                version_groups[version_str].append(file)
-            else:
-                version_groups[version_str] = [file]
+    version_slices = _get_version_slices(version_matches, padding_match)
+    version_groups = defaultdict(list)
+    last_entries = dict()
+    for file, entry in files:
+        version_str = None
+        if version_slices:
+            # Discard files where version strings are not all equal
+            start, end = version_slices[-1]
+            version_str = file[start:end]
+            if any(file[s:e] != version_str for s, e in version_slices[:-1]):
+                continue
+        version_groups[version_str].append(file)
+
+        # Files are unsorted, keep the last one of each version
+        last = last_entries.get(version_str)
+        if last is None or file > last[0]:
+            last_entries[version_str] = (file, entry)
+
+    # Capture the timestamp of the last file of each version
+    version_mtimes = dict()
+    for version_str, (file, entry) in last_entries.items():
+        version_mtimes[version_str] = _file_mtime(file, entry, root_dir)
 
     # Format the result
     if version_groups:
-        return _format_result(version_groups, padding_match)
+        return _format_result(version_groups, version_mtimes, padding_match)
     return []
 
 
 # Private helpers -------------------------------------------------------------
-def _get_path_version_strings(
+def _list_files(
     path: str,
+    spans: Tuple[Tuple[int, int, int], ...],
+    root_dir: Optional[str] = None,
+) -> List[Tuple[str, Optional[os.DirEntry]]]:
+    """Return the paths of the files related to `path`, unsorted
+
+    The path is resolved one component at a time. Literal components are kept as-is
+    without touching the disk. Components containing versions/padding list their
+    parent directories once with `os.scandir` and filter the entries with a single
+    regex built from the spans.
+
+    Args:
+        path:           Path to scan.
+        spans:          Digit spans of the versions and padding, sorted.
+        root_dir:       Working directory for relative paths.
+                        None will use the current working directory.
+
+    Returns:
+        Paths sharing the same structure as `path`
+        paired with their directory entry when available.
+    """
+    if not path:
+        return []
+    if not root_dir or os.path.isabs(path):
+        root_dir = ""
+
+    # The directories before the first substitution are kept as-is
+    start = len(_split_basename(path[: spans[0][0]])[0]) if spans else 0
+
+    # Resolved prefixes, with the entry of their last component
+    candidates = [(path[:start], None)]
+    while True:
+        end = _find_separator(path, start)
+        last = end == len(path)
+        component_spans = tuple(i for i in spans if start <= i[0] < end)
+
+        # Literal component
+        if not component_spans:
+            component = path[start : end + 1]
+            candidates = [(prefix + component, None) for prefix, _ in candidates]
+
+            # The files must exist. A trailing separator only matches directories
+            if last:
+                exists = os.path.lexists if component else os.path.isdir
+                candidates = [
+                    (file, entry)
+                    for file, entry in candidates
+                    if exists(os.path.join(root_dir, file))
+                ]
+
+        # Versioned component
+        else:
+            name_re = _filename_regex(path, start, end, component_spans)
+            skip_hidden = not path.startswith(".", start)
+            sep = path[end : end + 1]
+            resolved = []
+            for prefix, _ in candidates:
+                scan_dir = os.path.join(root_dir, prefix) if prefix else root_dir
+                for entry in _scan_dir(scan_dir or os.curdir, name_re, skip_hidden):
+                    if last:
+                        resolved.append((prefix + entry.name, entry))
+                    elif _is_dir(entry):
+                        resolved.append((prefix + entry.name + sep, entry))
+            candidates = resolved
+
+        if last or not candidates:
+            break
+        start = end + 1
+
+    return candidates
+
+
+def _scan_plain_path(path: str, root_dir: Optional[str] = None) -> List[Version]:
+    """Return the version of a path without version nor padding, if it exists
+
+    Args:
+        path:       Path to scan.
+        root_dir:   Working directory for relative paths.
+                    None will use the current working directory.
+    """
+    full_path = os.path.join(root_dir or "", path)
+
+    # A trailing separator only matches a directory
+    if path.endswith(_SEPARATORS) and not os.path.isdir(full_path):
+        return []
+
+    try:
+        mtime = os.stat(full_path).st_mtime
+    except OSError:
+        # Broken links are still listed, like a directory scan would
+        if not os.path.lexists(full_path):
+            return []
+        mtime = None
+    return [Version(path, None, [], mtime)]
+
+
+def _find_separator(path: str, start: int) -> int:
+    """Return the index of the next separator in a path, or its length"""
+    indices = [i for i in (path.find(sep, start) for sep in _SEPARATORS) if i != -1]
+    return min(indices) if indices else len(path)
+
+
+def _scan_dir(
+    scan_dir: str, name_re: re.Pattern, skip_hidden: bool
+) -> List[os.DirEntry]:
+    """Return the entries of a directory whose name matches a regex
+
+    Args:
+        scan_dir:       Directory to list.
+        name_re:        Regex the entry names must match.
+        skip_hidden:    True will discard names starting with a '.' like glob does.
+    """
+    matches = []
+    try:
+        with os.scandir(scan_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if skip_hidden and name.startswith("."):
+                    continue
+                if name_re.match(name):
+                    matches.append(entry)
+    except OSError:
+        return []
+    return matches
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    """Return True if the entry is a directory, following symlinks"""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _version_span(m: re.Match) -> Tuple[int, int, int]:
+    """Return the (start, end, size) of the digits of a captured version
+
+    The Match object must have a group(1) that
+    captures the number part of the version string.
+    ex: 'v01' -> digits '01'
+    """
+    return m.start(1), m.end(1), len(m.group(1))
+
+
+def _padding_span(m: re.Match) -> Tuple[int, int, int]:
+    """Return the (start, end, size) of a captured frame padding
+
+    If a group(1) exist, its value will be converted to integer and
+    used to determine the size of the padding.
+    ex: '####' -> 4, '%02d' -> 2
+    """
+    try:
+        size = int(m.group(1))
+    except IndexError:
+        size = len(m.group(0))
+    return m.start(0), m.end(0), size
+
+
+@functools.lru_cache(maxsize=1024)
+def _filename_regex(
+    path: str, start: int, end: int, spans: Tuple[Tuple[int, int, int], ...]
+) -> re.Pattern:
+    """Compile a regex matching a path component of any version/frame
+
+    The digits are fixed-width, so matching never backtracks.
+    Cached, as rescanning the same path rebuilds the same regex.
+    ex: 'name_v01.####.exr' -> 'name_v[0-9]{2}\\.[0-9]{4}\\.exr'
+
+    Args:
+        path:   Path to convert.
+        start:  Index of the component in `path`.
+        end:    Index past the end of the component in `path`.
+        spans:  Digit spans of the versions and padding located in the component, sorted.
+    """
+    parts = []
+    cursor = start
+    for sub_start, sub_end, size in spans:
+        parts.append(re.escape(path[cursor:sub_start]))
+        parts.append(f"[0-9]{{{size}}}")
+        cursor = sub_end
+    parts.append(re.escape(path[cursor:end]))
+    parts.append(r"\Z")
+
+    # Mimic glob: case-insensitive on Windows
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("".join(parts), flags)
+
+
+def _file_mtime(
+    path: str, entry: Optional[os.DirEntry], root_dir: Optional[str] = None
+) -> Optional[float]:
+    """Return the modification time of a listed file
+
+    Args:
+        path:       Listed path.
+        entry:      Directory entry of the path if available.
+        root_dir:   Working directory for relative paths.
+    """
+    try:
+        if entry is not None:
+            return entry.stat().st_mtime
+        return os.stat(os.path.join(root_dir or "", path)).st_mtime
+    except OSError:
+        return None
+
+
+def _split_basename(path: str) -> Tuple[str, str]:
+    """Split a path after its last separator
+
+    Unlike `os.path.split`, the directory part is returned untouched
+    with its trailing separator. ex: 'dir//file.exr' -> ('dir//', 'file.exr')
+    """
+    idx = max(path.rfind(sep) for sep in _SEPARATORS) + 1
+    return path[:idx], path[idx:]
+
+
+def _get_version_slices(
     version_matches: List[re.Match],
     padding_match: Optional[re.Match],
-) -> List[str]:
-    """Extract the version sub-strings from a path given Match objects from a similar path
+) -> List[Tuple[int, int]]:
+    """Return the slices of the version sub-strings in the scanned files
+
+    The scanned files have frames in place of the padding,
+    which shifts the versions located after it.
 
     Args:
-        path:               Path to inspect.
-        version_matches:    Match objects from another similar path.
-        padding_match:      Match object from another similar path.
+        version_matches:    Match objects from the scanned path.
+        padding_match:      Match object from the scanned path.
 
     Returns:
-        Version sub-strings
+        (start, end) of each version sub-string
     """
     # Calculate offset to apply to replace operations
     # that come after the padding operation.
@@ -232,24 +528,25 @@ def _get_path_version_strings(
         except IndexError:
             offset_len = 0
 
-    # Find the versions
-    versions = []
+    slices = []
     for m in version_matches:
         offset = 0
         if m.start(0) > offset_idx:
             offset = offset_len
-        v = path[m.start(0) + offset : m.end(0) + offset]
-        versions.append(v)
-    return versions
+        slices.append((m.start(0) + offset, m.end(0) + offset))
+    return slices
 
 
 def _format_result(
-    version_groups: Dict[str, List[str]], m: Optional[re.Match]
-) -> List[VersionType]:
+    version_groups: Dict[str, List[str]],
+    version_mtimes: Dict[str, Optional[float]],
+    m: Optional[re.Match],
+) -> List[Version]:
     """Format the return value of `scan_files`
 
     Args:
         version_groups: Versions dictionary.
+        version_mtimes: Modification time of each version.
         m:              Frame padding regex Match object.
     """
     result = list()
@@ -268,32 +565,44 @@ def _format_result(
         end = start + size
 
         for version_str in sorted(version_groups):
-            version_files = version_groups[version_str]
+            version_files = sorted(version_groups[version_str])
 
             # Replace: Frame -> Padding
-            padded_path = version_files[0]
-            padded_path = padded_path[:start] + pad_str + padded_path[end:]
+            first = version_files[0]
+            padded_path = f"{first[:start]}{pad_str}{first[end:]}"
 
             # Extract frame strings
-            frames = []
-            for file in version_files:
-                frame_str = file[start:end]
-                frames.append(frame_str)
-            result.append((padded_path, version_str, frames))
+            frames = [file[start:end] for file in version_files]
+            result.append(
+                Version(padded_path, version_str, frames, version_mtimes[version_str])
+            )
 
     # No padding in path
     else:
         for version_str in sorted(version_groups):
             version_files = version_groups[version_str]
 
-            padded_path = version_files[0]
+            padded_path = min(version_files)
             frames = []
-            result.append((padded_path, version_str, frames))
+            result.append(
+                Version(padded_path, version_str, frames, version_mtimes[version_str])
+            )
 
     return result
 
 
 # Utility ---------------------------------------------------------------------
+def compile_patterns(
+    patterns: Iterable[Union[str, re.Pattern]]
+) -> Tuple[re.Pattern, ...]:
+    """Compile regex patterns once, keeping the already compiled ones as-is
+
+    Args:
+        patterns:   Regex patterns or their source strings.
+    """
+    return tuple(re.compile(p) if isinstance(p, str) else p for p in patterns)
+
+
 def replace_re_match(
     string: str,
     repl: str,
@@ -304,18 +613,3 @@ def replace_re_match(
     start = m.start(group) + offset
     end = m.end(group) + offset
     return string[:start] + repl + string[end:]
-
-
-class WorkingDirectory:
-    """Context manager for operating under a specific working directory"""
-
-    def __init__(self, working_directory: str) -> None:
-        self._old = "."
-        self._new = working_directory
-
-    def __enter__(self):
-        self._old = os.getcwd()
-        os.chdir(self._new)
-
-    def __exit__(self, _type, _value, _traceback):
-        os.chdir(self._old)
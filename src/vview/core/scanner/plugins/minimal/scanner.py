@@ -1,53 +1,113 @@
 import datetime
+import os
 import re
-from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Union
 
 from vview.core.scanner.interface import IVersionScanner
-from vview.core.utils import format_frames
 
 from .core import (
-    HASH_RE,
-    STRF_RE,
-    VERS_RE,
-    VersionType,
-    WorkingDirectory,
-    re_match_padding,
+    _DEFAULT_PADDING_PATTERNS,
+    _DEFAULT_VERSION_PATTERNS,
+    Version,
+    _split_basename,
+    compile_patterns,
     re_match_versions,
-    replace_re_match,
     scan_versions,
 )
 
 
 class MinimalVersionScanner(IVersionScanner):
+    __slots__ = (
+        "root_dir",
+        "version_patterns",
+        "padding_patterns",
+        "_scan_cache",
+        "_scan_cache_lock",
+    )
+
+    MAX_SCAN_WORKERS = 32
+    # Maximum amount of paths scanned concurrently by `scan_versions_many`.
+    # Directory listings release the GIL, which overlaps network file-system latency.
+    SCAN_CACHE_SIZE = 128
+    # Maximum amount of scan results kept by `scan_versions`.
+    # A result stays valid as long as the mtime of its scanned directory is unchanged,
+    # which happens whenever a file is added, removed or renamed in it.
+    SCAN_CACHE_TTL = 5.0
+    # Seconds during which a scan result is trusted.
+    # Files rewritten in place, or changes within the mtime granularity of network
+    # file-systems, leave the directory mtime unchanged.
+
     def __init__(
         self,
         root_dir: Optional[str] = None,
-        version_patterns: Optional[Iterable[re.Pattern]] = None,
-        padding_patterns: Optional[Iterable[re.Pattern]] = None,
+        version_patterns: Optional[Iterable[Union[str, re.Pattern]]] = None,
+        padding_patterns: Optional[Iterable[Union[str, re.Pattern]]] = None,
     ) -> None:
         """Version scanner implementation that aims to be as bare-bones as possible
 
         Args:
             root_dir:           Working directory for relative paths.
             version_patterns:   List of patterns that can capture the version sub-string(s).
+                                Strings are compiled once at construction.
                                 Only the first pattern to work will be used.
                                 version ex: 'v1', 'V1', 'v001', 'V00000001'
             padding_patterns:   List of patterns that can capture the padding sub-string.
+                                Strings are compiled once at construction.
                                 Only the first pattern to work will be used.
                                 padding ex: '##',   '####', '########'
                                             '%02d', '%04d', '%08d'
         """
         self.root_dir = root_dir
         self.version_patterns = (
-            [VERS_RE] if version_patterns is None else version_patterns
+            _DEFAULT_VERSION_PATTERNS
+            if version_patterns is None
+            else compile_patterns(version_patterns)
         )
         self.padding_patterns = (
-            [STRF_RE, HASH_RE] if padding_patterns is None else padding_patterns
+            _DEFAULT_PADDING_PATTERNS
+            if padding_patterns is None
+            else compile_patterns(padding_patterns)
         )
+        self._scan_cache = OrderedDict()
+        self._scan_cache_lock = threading.Lock()
 
     # Scan --------------------------------------------------------------------
-    def scan_versions(self, path: str) -> List[VersionType]:
+    def scan_versions(self, path: str) -> List[Version]:
+        key = self._scan_cache_key(path)
+        if key is None:
+            return self._scan_versions(path)
+
+        now = time.monotonic()
+        with self._scan_cache_lock:
+            entry = self._scan_cache.get(key)
+            if entry is not None and now - entry[0] <= self.SCAN_CACHE_TTL:
+                self._scan_cache.move_to_end(key)
+                versions = entry[1]
+            else:
+                versions = None
+
+        # Callers own the versions they are given, cached ones are left untouched
+        if versions is not None:
+            return [version.copy() for version in versions]
+
+        versions = self._scan_versions(path)
+        with self._scan_cache_lock:
+            self._scan_cache[key] = (now, versions)
+            self._scan_cache.move_to_end(key)
+            if len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+        return [version.copy() for version in versions]
+
+    def clear_scan_cache(self) -> None:
+        """Forget the scan results, the next scans will read the disk again"""
+        with self._scan_cache_lock:
+            self._scan_cache.clear()
+
+    def _scan_versions(self, path: str) -> List[Version]:
         return scan_versions(
             path,
             root_dir=self.root_dir,
@@ -55,78 +115,99 @@ class MinimalVersionScanner(IVersionScanner):
             padding_patterns=self.padding_patterns,
         )
 
+    def _scan_cache_key(self, path: str) -> Optional[Tuple[str, str, int]]:
+        """Return the cache key of a scan, or None if it cannot be cached
+
+        Only scans that list a single directory can be invalidated by its mtime.
+        """
+        if not path:
+            return None
+
+        # Versions in the directories are spread over many directories
+        dirname, _ = _split_basename(path)
+        for pattern in self.version_patterns:
+            version_matches = re_match_versions(path, pattern)
+            if version_matches:
+                if version_matches[0].start(0) < len(dirname):
+                    return None
+                break
+
+        scan_dir = dirname or os.curdir
+        if self.root_dir and not os.path.isabs(path):
+            scan_dir = os.path.join(self.root_dir, dirname)
+        # Relative paths depend on the current working directory
+        try:
+            return os.path.abspath(scan_dir), path, os.stat(scan_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def scan_versions_many(self, paths: List[str]) -> List[List[Version]]:
+        # Identical paths are only scanned once
+        unique_paths = list(dict.fromkeys(paths))
+        if len(unique_paths) <= 1:
+            results = [self.scan_versions(path) for path in unique_paths]
+        else:
+            workers = min(self.MAX_SCAN_WORKERS, len(unique_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self.scan_versions, unique_paths))
+
+        versions_by_path = dict(zip(unique_paths, results))
+        return [versions_by_path[path] for path in paths]
+
     # Name --------------------------------------------------------------------
-    def version_raw_name(self, version: VersionType) -> Optional[str]:
-        return version[1]
+    def version_raw_name(self, version: Version) -> Optional[str]:
+        return version.version_str
 
-    def version_contains_name(self, version: VersionType) -> bool:
+    def version_contains_name(self, version: Version) -> bool:
         return self.version_raw_name(version) is not None
 
-    def version_formatted_name(self, version: VersionType) -> str:
-        _, version_str, _ = version
-        return version_str if version_str else "n/a"
+    def version_formatted_name(self, version: Version) -> str:
+        return version.version_str if version.version_str else "n/a"
 
     # Path --------------------------------------------------------------------
-    def version_raw_path(self, version: VersionType) -> str:
-        padded_path, _, _ = version
-        return str(padded_path)
+    def version_raw_path(self, version: Version) -> str:
+        return str(version.padded_path)
 
-    def version_formatted_path(self, version: VersionType) -> str:
+    def version_formatted_path(self, version: Version) -> str:
         return self.version_raw_path(version)
 
-    def version_absolute_path(self, version: VersionType) -> str:
-        padded_path, _, _ = version
-        p = Path(str(padded_path))
+    def version_absolute_path(self, version: Version) -> str:
+        path = str(version.padded_path)
 
         # Custom working directory
         if self.root_dir:
-            if not p.is_absolute():
-                with WorkingDirectory(self.root_dir):
-                    p = p.absolute()
-                return str(p)
+            path = os.path.join(self.root_dir, path)
 
         # Default working directory
-        return str(p.absolute())
+        return os.path.abspath(path)
 
     def path_replace_version_name(self, path: str, version_str: str) -> str:
         for pattern in self.version_patterns:
             version_matches = re_match_versions(path, pattern)
             if version_matches:
-                for version_match in reversed(version_matches):
-                    path = replace_re_match(path, version_str, version_match)
-                return path
+                # Splice every match in a single pass
+                parts = []
+                cursor = 0
+                for version_match in version_matches:
+                    parts.append(path[cursor : version_match.start(0)])
+                    parts.append(version_str)
+                    cursor = version_match.end(0)
+                parts.append(path[cursor:])
+                return "".join(parts)
         return path
 
     # Frames ------------------------------------------------------------------
-    def version_frame_range(self, version: VersionType) -> Optional[Tuple[int, int]]:
-        _, _, str_frames = version
-        if str_frames:
-            return int(str_frames[0]), int(str_frames[-1])
+    def version_frame_range(self, version: Version) -> Optional[Tuple[int, int]]:
+        return version.frame_range
 
-    def version_formatted_frames(self, version: VersionType) -> str:
-        _, _, str_frames = version
-        int_frames = [int(f) for f in str_frames]
-        return format_frames(int_frames, sep=", ") or "n/a"
+    def version_formatted_frames(self, version: Version) -> str:
+        return version.formatted_frames or "n/a"
 
     # Date --------------------------------------------------------------------
-    def version_formatted_date(self, version: VersionType) -> str:
-        _, _, str_frames = version
-
-        # Use the absolute path as-is if there is no frame padding
-        path = self.version_absolute_path(version)
-
-        # Format the last frame if there is frame padding
-        if str_frames:
-            for pattern in self.padding_patterns:
-                padding_match = re_match_padding(path, pattern)
-                if padding_match:
-                    path = replace_re_match(path, str_frames[-1], padding_match)
-                    break
-
-        # Get timestamp from existing file
-        path = Path(path)
-        if path and path.is_file():
-            date = datetime.datetime.fromtimestamp(path.stat().st_mtime)
-            return date.strftime("%Y-%m-%d %H:%M")
-
-        return "n/a"
+    def version_formatted_date(self, version: Version) -> str:
+        # The timestamp was captured while scanning
+        if version.mtime is None:
+            return "n/a"
+
+        date = datetime.datetime.fromtimestamp(version.mtime)
+        return date.strftime("%Y-%m-%d %H:%M")
@@ -0,0 +1,48 @@
+from typing import TYPE_CHECKING, Any
+
+from vview.core.utils import elide_middle
+
+if TYPE_CHECKING:
+    from vview.core.scanner.interface import IVersionScanner
+
+
+_PRETTY_STR_TEMPLATE = (
+    "| {blank} | frames: {frames} |\n"
+    "| {name} |   path: {path} |\n"
+    "| {blank} |   date: {date} |"
+)
+# Layout of `version_pretty_str`
+
+
+# Print -----------------------------------------------------------------------
+def version_pretty_str(
+    scanner: "IVersionScanner", version: Any, max_len: int = 90
+) -> str:
+    """Return a pretty string of a `version`
+
+    Args:
+        scanner:    Scanner that produced the version.
+        version:    Version to render.
+        max_len:    Maximum string width.
+    """
+    if version is None:
+        return str(None)
+
+    name = scanner.version_formatted_name(version)
+    dead_space = 15
+    suffix_len = max_len - dead_space - len(name)
+
+    # `elide_middle` pads the values to the full width
+    frames = elide_middle(scanner.version_formatted_frames(version), suffix_len)
+    path = elide_middle(scanner.version_formatted_path(version), suffix_len)
+    date = elide_middle(scanner.version_formatted_date(version), suffix_len)
+
+    return _PRETTY_STR_TEMPLATE.format_map(
+        {
+            "name": name,
+            "blank": " " * len(name),
+            "frames": frames,
+            "path": path,
+            "date": date,
+        }
+    )
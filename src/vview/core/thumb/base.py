@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 from enum import Enum
 
 
@@ -51,3 +51,15 @@ class IThumbCache:
             callback_kwargs:    Keyword arguments for the callback
         """
         raise NotImplementedError
+
+    def get_create_many(self, requests: Iterable[dict]) -> None:
+        """Get many thumbnails from the cache or generate the missing ones
+
+        Implementations may generate them together, which is cheaper than
+        separate calls to `get_create`.
+
+        Args:
+            requests:   Keyword arguments of `get_create` for each thumbnail.
+        """
+        for request in requests:
+            self.get_create(**request)
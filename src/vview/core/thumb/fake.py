@@ -1,4 +1,6 @@
+import functools
 import random
+import sched
 import threading
 import time
 from typing import Callable, Optional
@@ -19,6 +21,11 @@ class FakeTumbCache(IThumbCache):
         self.delay = delay
         self.rand_delay = rand_delay
 
+        # A single thread fires the callbacks of every pending thumbnail
+        self._scheduler = sched.scheduler(time.monotonic, time.sleep)
+        self._thread = None
+        self._lock = threading.Lock()
+
     def get_create(
         self,
         source: str,
@@ -36,24 +43,45 @@ class FakeTumbCache(IThumbCache):
             callback_args = tuple()
         if callback_kwargs is None:
             callback_kwargs = dict()
-        path = source
-
-        # Convert a nuke sequence to a single frame
-        # ex: 'name.####.exr 1-10' -> 'name.0001.exr'
-        # ex: 'name.%02d.exr 1-10' -> 'name.01.exr'
-        padded_path, start, _ = strip_nuke_sequence(path)
-        if isinstance(start, int):
-            path = padded_set_frame(padded_path, start)
+        path = _first_frame_path(source)
 
         # Set delay
         delay = self.delay + random.random() * self.rand_delay
 
         # 'Work'
-        def wait_delay():
-            time.sleep(delay)
-            if callable(callback):
-                callback(path, *callback_args, **callback_kwargs)
-
-        # Start thread
-        thread = threading.Thread(target=wait_delay)
-        thread.start()
+        if callable(callback):
+            with self._lock:
+                self._scheduler.enter(
+                    delay,
+                    1,
+                    callback,
+                    argument=(path,) + tuple(callback_args),
+                    kwargs=callback_kwargs,
+                )
+
+                # Start thread
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        """Fire the scheduled callbacks until none are left"""
+        while True:
+            self._scheduler.run()
+            with self._lock:
+                if self._scheduler.empty():
+                    self._thread = None
+                    return
+
+
+@functools.lru_cache(maxsize=2048)
+def _first_frame_path(source: str) -> str:
+    """Convert a nuke sequence to a single frame
+
+    ex: 'name.####.exr 1-10' -> 'name.0001.exr'
+    ex: 'name.%02d.exr 1-10' -> 'name.01.exr'
+    """
+    padded_path, start, _ = strip_nuke_sequence(source)
+    if isinstance(start, int):
+        return padded_set_frame(padded_path, start)
+    return source
@@ -40,27 +40,94 @@ p.run(callback=print_path)
 ```
 """
 
+import functools
+import hashlib
+import json
 import logging
 import logging.handlers
+import os
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import traceback
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, namedtuple
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from types import SimpleNamespace
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 import nuke
 
 from vview.core.thumb.base import FrameMode, IThumbCache
 
-thread_pool = ThreadPoolExecutor(max_workers=24)
+# Faster encoding of the jobs sent to the workers, when available
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ModuleNotFoundError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+DEFAULT_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+# Maximum amount of nuke subprocesses generating thumbnails at the same time.
+# Each one is a full nuke interpreter, extra requests wait in the queue.
+# Can be overridden with the `VVIEW_THUMB_WORKERS` environment variable.
+
+
+def _valid_max_workers(value) -> int:
+    """At least one worker. The default when the value is not an integer"""
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_WORKERS
+
+
+MAX_WORKERS = _valid_max_workers(os.environ.get("VVIEW_THUMB_WORKERS"))
+thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 warned_of_process_failed = False
+_MISSING = object()
+_Pending = namedtuple("_Pending", "callback args kwargs previous")
+# Callback waiting on a thumbnail being generated.
+# Stored in place of the output path, chained to the callback registered before it.
+
+
+def set_max_workers(max_workers: int) -> None:
+    """Change the amount of thumbnails generated at the same time
+
+    Thumbnails already queued are still generated by the previous pool.
+
+    Args:
+        max_workers:    Maximum amount of concurrent nuke subprocesses.
+                        Clamped to at least one.
+    """
+    global thread_pool
+    previous_pool = thread_pool
+    thread_pool = ThreadPoolExecutor(max_workers=_valid_max_workers(max_workers))
+    previous_pool.shutdown(wait=False)
 
 
 class TempCache(IThumbCache):
     ROOT_DIR = Path(tempfile.gettempdir()) / "vview"
+    MAX_SIZE = 4096
+    # Maximum amount of thumbnails remembered in memory.
+    # The least recently used ones are forgotten first, their files are kept on disk.
+    BATCH_SIZE = 8
+    # Maximum amount of thumbnails sent at once to a worker by `get_create_many`.
+    # Larger batches pay less overhead but spread less over the workers.
+    DISK_INDEX_TTL = 5.0
+    # Seconds during which a listing of a cache directory is trusted.
+    # Files are looked up in the listing instead of being stat one by one.
+    LOCK_POLL_INTERVAL = 0.25
+    # Seconds between checks of thumbnails being generated by another nuke session.
+    LOCK_TIMEOUT = 120.0
+    # Seconds after which the lock of another session is considered abandoned.
 
     def __init__(self):
         """Temporary thumbnails cache
@@ -71,8 +138,23 @@ class TempCache(IThumbCache):
         This cache is meant to be quick and re-use thumbnails created in previous
         nuke sessions as long as the OS decides to keep them.
         """
-        self._cache = dict()
-        self._callbacks = defaultdict(list)
+        self._cache = OrderedDict()
+        self._max_size = self.MAX_SIZE
+        self._disk_index = dict()
+        self._has_legacy = None
+        self._watched = dict()
+        self._watcher = None
+        self._watch_lock = threading.Lock()
+
+    def set_max_size(self, max_size: int) -> None:
+        """Change the amount of thumbnails remembered in memory
+
+        Args:
+            max_size:   Maximum amount of entries. Thumbnails being generated
+                        are never forgotten and can exceed it.
+        """
+        self._max_size = max_size
+        self._evict()
 
     def get_create(
         self,
@@ -87,12 +169,63 @@ class TempCache(IThumbCache):
         callback_args: Optional[tuple] = None,
         callback_kwargs: Optional[dict] = None,
     ) -> None:
+        job = self._get_or_prepare(
+            source,
+            width=width,
+            height=height,
+            frame_mode=frame_mode,
+            custom_frame=custom_frame,
+            source_colorspace=source_colorspace,
+            output_colorspace=output_colorspace,
+            callback=callback,
+            callback_args=callback_args,
+            callback_kwargs=callback_kwargs,
+        )
+        if job is not None:
+            process, key = job
+            process.run(self._generated, key)
+
+    def get_create_many(self, requests: Iterable[dict]) -> None:
+        # Thumbnails sharing the same nodes in the worker are batched together
+        jobs = []
+        for request in requests:
+            job = self._get_or_prepare(**request)
+            if job is not None:
+                jobs.append(job)
+        jobs.sort(key=lambda job: job[0].graph_key())
+
+        # The key is the only argument of `_generated` after the output
+        for i in range(0, len(jobs), self.BATCH_SIZE):
+            batch = jobs[i : i + self.BATCH_SIZE]
+            batch = [(process, (key,)) for process, key in batch]
+            ThumbProcess.run_many(batch, self._generated)
+
+    def _get_or_prepare(
+        self,
+        source: str,
+        width: int = 100,
+        height: int = 100,
+        frame_mode: FrameMode = FrameMode.MIDDLE,
+        custom_frame: int = 1,
+        source_colorspace: Optional[str] = None,
+        output_colorspace: Optional[str] = None,
+        callback: Optional[Callable] = None,
+        callback_args: Optional[tuple] = None,
+        callback_kwargs: Optional[dict] = None,
+    ) -> Optional[Tuple["ThumbProcess", tuple]]:
+        """Serve a thumbnail from the cache, or prepare its generation
+
+        Takes the arguments of `get_create()`.
+
+        Returns:
+            Process to run with its key when the thumbnail must be generated
+        """
         if callback_args is None:
             callback_args = tuple()
         if callback_kwargs is None:
             callback_kwargs = dict()
 
-        key = (
+        key = self._canon_key(
             source,
             width,
             height,
@@ -101,36 +234,56 @@ class TempCache(IThumbCache):
             source_colorspace,
             output_colorspace,
         )
-        output = self._format_filepath(str(key))
 
         # Cache hit
-        if key in self._cache.keys():
-            # Subprocess is already running. Add to list of callbacks
-            if self._cache[key] is None:
-                self._callbacks[key].append((callback, callback_args, callback_kwargs))
+        cached = self._cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            # Subprocess is already running. Add to chain of callbacks
+            if isinstance(cached, _Pending):
+                if callable(callback):
+                    self._cache[key] = _Pending(
+                        callback, callback_args, callback_kwargs, cached
+                    )
 
             # Already processed. Call immediately
             else:
+                self._cache.move_to_end(key)
                 if callable(callback):
-                    callback(output, *callback_args, **callback_kwargs)
+                    callback(cached, *callback_args, **callback_kwargs)
 
         # Cache miss
         else:
+            output = self._format_filepath(str(key))
+
+            # Thumbnails created by previous versions of vview
+            if not self._disk_ready(output) and self._has_legacy_files():
+                legacy_key = (
+                    source,
+                    width,
+                    height,
+                    frame_mode,
+                    custom_frame,
+                    source_colorspace,
+                    output_colorspace,
+                )
+                legacy_output = self._format_legacy_filepath(str(legacy_key))
+                if self._disk_ready(legacy_output):
+                    output = legacy_output
+
             # The file already exists. Add to cache. Call immediately
-            if Path(output).is_file():
+            if self._disk_ready(output):
                 self._cache[key] = output
+                self._evict()
                 if callable(callback):
                     callback(output, *callback_args, **callback_kwargs)
 
             # Start processing
             else:
-                # Set value to None to prevent multiple process for the same key
-                self._cache[key] = None
-
-                # Add callback for key
-                self._callbacks[key].append((callback, callback_args, callback_kwargs))
+                # Set callback as value to prevent multiple process for the same key
+                self._cache[key] = _Pending(
+                    callback, callback_args, callback_kwargs, None
+                )
 
-                # Launch subprocess
                 p = ThumbProcess(
                     source=source,
                     output=output,
@@ -138,28 +291,233 @@ class TempCache(IThumbCache):
                     height=height,
                     frame_mode=frame_mode,
                     custom_frame=custom_frame,
-                    source_colorspace=source_colorspace,
-                    output_colorspace=output_colorspace,
+                    source_colorspace=source_colorspace or None,
+                    output_colorspace=output_colorspace or None,
                 )
-                p.run(self._process_finished, key)
+
+                # Another nuke session is already generating it
+                if not self._lock(output):
+                    self._watch(output, p, key)
+                    return None
+
+                return p, key
+
+        return None
+
+    @staticmethod
+    def _canon_key(
+        source: str,
+        width: int,
+        height: int,
+        frame_mode: FrameMode,
+        custom_frame: int,
+        source_colorspace: Optional[str],
+        output_colorspace: Optional[str],
+    ) -> tuple:
+        """Generate the key of a thumbnail
+
+        Requests producing the same image share the same key.
+        The custom frame is only relevant with FrameMode.CUSTOM
+        and empty colorspaces are the default ones.
+        """
+        return (
+            source,
+            width,
+            height,
+            frame_mode,
+            custom_frame if frame_mode == FrameMode.CUSTOM else None,
+            source_colorspace or None,
+            output_colorspace or None,
+        )
 
     @classmethod
     def _format_filepath(cls, key_str: str):
         """Generate the filepath for a key"""
+        name = hashlib.blake2b(key_str.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(cls.ROOT_DIR, name[:2], name[2:] + ".png")
+
+    @classmethod
+    def _format_legacy_filepath(cls, key_str: str):
+        """Generate the filepath for a key, as named by previous versions"""
         name = str(uuid.uuid5(uuid.NAMESPACE_DNS, key_str))
-        return str(Path(cls.ROOT_DIR) / name[:2] / (name[2:] + ".png"))
+        return os.path.join(cls.ROOT_DIR, name[:2], name[2:] + ".png")
+
+    def _has_legacy_files(self) -> bool:
+        """Whether thumbnails named by previous versions of vview are on disk
+
+        Only checked once, since new thumbnails never get these names.
+        """
+        if self._has_legacy is None:
+            self._has_legacy = False
+            try:
+                with os.scandir(self.ROOT_DIR) as dirs:
+                    for directory in dirs:
+                        if len(directory.name) != 2 or not directory.is_dir():
+                            continue
+                        # Only the uuid names contain dashes
+                        with os.scandir(directory.path) as files:
+                            if any("-" in file.name for file in files):
+                                self._has_legacy = True
+                                break
+            except OSError:
+                pass
+        return self._has_legacy
+
+    def _disk_has(self, filepath: str) -> bool:
+        """Whether a file exists, according to a recent listing of its directory"""
+        dirname, name = os.path.split(filepath)
+        now = time.monotonic()
+        index = self._disk_index.get(dirname)
+        if index is None or now - index[0] > self.DISK_INDEX_TTL:
+            try:
+                with os.scandir(dirname) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = dict()
+            index = (now, entries)
+            self._disk_index[dirname] = index
+
+        # The type of the entries comes with the listing. Only symlinks are stat
+        entry = index[1].get(name)
+        return entry is not None and entry.is_file()
+
+    def _disk_ready(self, filepath: str) -> bool:
+        """Whether a thumbnail is complete on disk
+
+        The lock next to a thumbnail is only removed once its file is fully written.
+        """
+        return self._disk_has(filepath) and not self._disk_has(filepath + ".lock")
+
+    def _lock(self, output: str) -> bool:
+        """Reserve the generation of a thumbnail among the nuke sessions
+
+        Returns:
+            False if another session holds the lock
+        """
+        lock = output + ".lock"
+        try:
+            os.makedirs(os.path.dirname(lock), exist_ok=True)
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            return False
+
+        # Without a lock, generate the thumbnail anyway
+        except OSError:
+            return True
+
+        os.close(fd)
+        return True
+
+    def _watch(self, output: str, process: "ThumbProcess", key: tuple):
+        """Wait for another session to generate a thumbnail"""
+        with self._watch_lock:
+            self._watched[output] = (process, key)
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._poll_locks, daemon=True)
+                self._watcher.start()
+
+    def _poll_locks(self):
+        """Check the watched thumbnails until none are left
+
+        Thumbnails are finished once their lock is released next to their file.
+        They are generated by this session instead if their lock is released
+        without a file or abandoned.
+        """
+        while True:
+            time.sleep(self.LOCK_POLL_INTERVAL)
+            with self._watch_lock:
+                watched = list(self._watched.items())
+
+            for output, (process, key) in watched:
+                # The file is only complete once the lock is released
+                lock = output + ".lock"
+                try:
+                    age = time.time() - os.stat(lock).st_mtime
+                except OSError:
+                    age = None
+                if age is not None and age < self.LOCK_TIMEOUT:
+                    continue
+
+                # Stop watching before dispatching, `_relaunch` may watch it again
+                with self._watch_lock:
+                    del self._watched[output]
+
+                if age is None and os.path.isfile(output):
+                    nuke.executeInMainThread(self._process_finished, args=(output, key))
+                else:
+                    if age is not None:
+                        _remove_file(lock)
+                    nuke.executeInMainThread(
+                        self._relaunch, args=(output, process, key)
+                    )
+
+            with self._watch_lock:
+                if not self._watched:
+                    self._watcher = None
+                    return
+
+    def _relaunch(self, output: str, process: "ThumbProcess", key: tuple):
+        """Generate a thumbnail that another session failed to generate"""
+        if self._lock(output):
+            process.run(self._generated, key)
+        else:
+            self._watch(output, process, key)
+
+    def _generated(self, output, key):
+        """This is run when a thumbnail generated by this session is complete"""
+        _remove_file(output + ".lock")
+        self._process_finished(output, key)
 
     def _process_finished(self, output, key):
         """This is run when a thumbnail generation is complete"""
 
+        # The directory listing no longer reflects the disk
+        self._disk_index.pop(os.path.dirname(output), None)
+
         # Prevent new callbacks to be added
+        pending = self._cache.get(key)
         self._cache[key] = output
-
-        # Exaust all callbacks
-        for callback, args, kwargs in self._callbacks[key]:
+        self._cache.move_to_end(key)
+
+        # Exaust all callbacks, in the order they were added
+        callbacks = []
+        while isinstance(pending, _Pending):
+            callbacks.append(pending)
+            pending = pending.previous
+        for callback, args, kwargs, _ in reversed(callbacks):
             if callable(callback):
                 callback(output, *args, **kwargs)
-        self._callbacks[key].clear()
+
+        # Custom frames are seldom requested twice. Only remember the ones
+        # requested again, which are then found on disk.
+        if key[3] == FrameMode.CUSTOM:
+            del self._cache[key]
+        else:
+            self._evict()
+
+    def _evict(self):
+        """Forget the least recently used thumbnails above the maximum size"""
+        excess = len(self._cache) - self._max_size
+        if excess <= 0:
+            return
+
+        # Thumbnails being generated still have callbacks waiting on them
+        stale = []
+        for key, output in self._cache.items():
+            if not isinstance(output, _Pending):
+                stale.append(key)
+                if len(stale) == excess:
+                    break
+        for key in stale:
+            del self._cache[key]
+
+
+def _remove_file(path: str):
+    """Remove a file if it exists"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 
 class ThumbProcess(object):
@@ -226,13 +584,50 @@ class ThumbProcess(object):
             *args:
             **kwargs:
         """
+        popen_args = self._popen_args()
+        thread_pool.submit(
+            self._run_in_thread, popen_args, callback, self._output, args, kwargs
+        )
+
+    @classmethod
+    def run_many(
+        cls,
+        jobs: List[Tuple["ThumbProcess", tuple]],
+        callback: Optional[Callable] = None,
+    ):
+        """Launches several thumbnail generations in the same subprocess
+
+        Once each thumbnail is done, `callback` will be called like so:
+        `callback(output_path, *args)` with the arguments of its job.
+
+        Args:
+            jobs:       Processes with the arguments of their callback.
+            callback:   Function to call when a thumbnail generation has finished.
+        """
+        thread_pool.submit(
+            cls._run_many_in_thread,
+            [(p._popen_args(), callback, p._output, args, {}) for p, args in jobs],
+        )
+
+    def graph_key(self) -> tuple:
+        """Thumbnails with the same key re-use the same nodes in a worker"""
+        return (
+            self._color_management or "",
+            self._ocio_config or "",
+            self._ocio_custom or "",
+            self._source_colorspace or "",
+            self._output_colorspace or "",
+        )
+
+    def _popen_args(self) -> List[str]:
+        """Command line running `main()` to generate the thumbnail"""
         # Nuke is tricky with its command line arguments.
         # Its better to end with strings to avoid un-expected results.
         # Set the numbers as early arguments.
         popen_args = [
             f"{sys.executable}",
             "-t",
-            f"{Path(__file__).absolute()}",
+            os.path.abspath(__file__),
             "-width",
             f"{self._width}",
             "-height",
@@ -272,30 +667,66 @@ class ThumbProcess(object):
                 f"{self._output}",
             ]
         )
-
-        thread_pool.submit(
-            self._run_in_thread, popen_args, callback, self._output, args, kwargs
-        )
+        return popen_args
 
     @classmethod
     def _run_in_thread(cls, popen_args, callback, output, args, kwargs):
-        # Combine stdout + stderr into stdout
-        p = subprocess.Popen(
-            popen_args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
-        )
-        std_out, _ = p.communicate()
+        cls._run_many_in_thread([(popen_args, callback, output, args, kwargs)])
 
-        # Callback
-        if callable(callback):
-            nuke.executeInMainThread(
-                callback, args=(output,) + tuple(args), kwargs=kwargs
-            )
+    @classmethod
+    def _run_many_in_thread(cls, jobs):
+        # Every job must finish, or its callbacks and lock would wait forever
+        done = 0
+        error = None
+        worker = None
+
+        # Re-use a running nuke to skip its startup
+        try:
+            worker = worker_pool.acquire()
+            for logs in worker.run_many([job[0][3:] for job in jobs]):
+                cls._finished(*jobs[done], logs)
+                done += 1
+        except OSError:
+            pass
+        except Exception:
+            error = traceback.format_exc()
+        finally:
+            # An interrupted worker is out of sync with its jobs
+            if worker is not None:
+                if done == len(jobs):
+                    worker_pool.release(worker)
+                else:
+                    worker.close()
+
+        # Fallback to one-shot subprocesses for the remaining jobs
+        for job in jobs[done:]:
+            logs = error
+            if logs is None:
+                try:
+                    # Combine stdout + stderr into stdout
+                    p = subprocess.run(
+                        job[0], stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+                    )
+                    logs = p.stdout.decode("utf-8", errors="replace")
+                except Exception:
+                    logs = traceback.format_exc()
+            cls._finished(*job, logs)
 
-        # Log failed
-        if not Path(output).is_file():
-            nuke.executeInMainThread(
-                cls.log, args=(popen_args, std_out.decode("utf-8"))
-            )
+    @classmethod
+    def _finished(cls, popen_args, callback, output, args, kwargs, logs):
+        # A failed dispatch must not interrupt the other jobs of the thread
+        try:
+            # Callback
+            if callable(callback):
+                nuke.executeInMainThread(
+                    callback, args=(output,) + tuple(args), kwargs=kwargs
+                )
+
+            # Log failed
+            if not os.path.isfile(output):
+                nuke.executeInMainThread(cls.log, args=(popen_args, logs))
+        except Exception:
+            logger.exception(f"Thumbnail callback failed: {output}")
 
     @classmethod
     def log(cls, popen_args, logs):
@@ -312,6 +743,241 @@ class ThumbProcess(object):
         logger.error(res)
 
 
+class ThumbWorker(object):
+    DONE_MARKER = "[vview] thumbnail done"
+    # Line printed by the worker once a job has been processed.
+
+    def __init__(self):
+        """Long-lived nuke subprocess generating thumbnails
+
+        Jobs are sent as JSON lines on its stdin. Each one holds a list of command
+        line arguments of `main()`, one per thumbnail.
+        This avoids paying the nuke startup for every thumbnail.
+        The subprocess exits by itself when its stdin is closed.
+        """
+        self._process = subprocess.Popen(
+            [f"{sys.executable}", "-t", os.path.abspath(__file__), "-worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            errors="replace",
+            bufsize=1,
+        )
+
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def run(self, argv: List[str]) -> str:
+        """Generate a thumbnail and wait for it to complete
+
+        Args:
+            argv:   Command line arguments of `main()`.
+
+        Returns:
+            Output of the subprocess while processing the job.
+
+        Raises:
+            OSError: The subprocess exited before completing the job.
+        """
+        return next(self.run_many([argv]))
+
+    def run_many(self, argvs: List[List[str]]) -> Iterator[str]:
+        """Generate several thumbnails, yielding as each one completes
+
+        Args:
+            argvs:  Command line arguments of `main()` for each thumbnail.
+
+        Yields:
+            Output of the subprocess while processing each job.
+
+        Raises:
+            OSError: The subprocess exited before completing the jobs.
+        """
+        self._process.stdin.write(_json_dumps(argvs) + "\n")
+        self._process.stdin.flush()
+
+        remaining = len(argvs)
+        logs = []
+        for line in self._process.stdout:
+            if line.rstrip("\n") == self.DONE_MARKER:
+                yield "".join(logs)
+                remaining -= 1
+                if not remaining:
+                    return
+                logs = []
+            else:
+                logs.append(line)
+        raise OSError("Thumbnail worker exited:\n" + "".join(logs))
+
+    def close(self):
+        """Let the subprocess exit once its current job is done"""
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+
+
+class ThumbWorkerPool(object):
+    IDLE_TIMEOUT = 60.0
+    # Seconds after which an unused worker is closed.
+    # Each one holds a nuke license and its memory until it exits.
+
+    def __init__(self):
+        """Idle thumbnail workers ready to be re-used
+
+        Each thread of `thread_pool` holds at most one worker at a time, so
+        the amount of workers never exceeds the amount of threads.
+        """
+        self._idle = []
+        # Release time and worker, the most recently released last.
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    def acquire(self) -> ThumbWorker:
+        """Return an idle worker, or start a new one if none are available"""
+        with self._lock:
+            while self._idle:
+                _, worker = self._idle.pop()
+                if worker.is_alive():
+                    return worker
+        return ThumbWorker()
+
+    def release(self, worker: ThumbWorker):
+        """Make a worker available to other jobs"""
+        if not worker.is_alive():
+            return
+        with self._lock:
+            self._idle.append((time.monotonic(), worker))
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap, daemon=True)
+                self._reaper.start()
+
+    def _reap(self):
+        """Close the workers left unused for too long until none are idle"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    self._reaper = None
+                    return
+                oldest = self._idle[0][0]
+            time.sleep(max(oldest + self.IDLE_TIMEOUT - time.monotonic(), 0.0))
+
+            deadline = time.monotonic() - self.IDLE_TIMEOUT
+            with self._lock:
+                stale = [worker for t, worker in self._idle if t <= deadline]
+                self._idle = [(t, worker) for t, worker in self._idle if t > deadline]
+            for worker in stale:
+                worker.close()
+
+
+def _worker_main():
+    """Process thumbnail jobs read from stdin until it is closed
+
+    Its used by the `ThumbWorker` class.
+
+    The nodes of a job are kept for the next ones with the same colorspaces.
+    Only their files and size are changed between jobs.
+    """
+    graphs = dict()
+    color_management = None
+    for line in sys.stdin:
+        for argv in _json_loads(line):
+            try:
+                args = _parse_args(argv)
+
+                # Scripts are written with the nodes of a single job
+                if args.writeScript:
+                    nuke.scriptClear()
+                    graphs.clear()
+                    color_management = None
+                    _generate(args)
+                    continue
+
+                # Colorspaces of the nodes may not exist in another configuration
+                job_management = (
+                    args.colorManagement,
+                    args.ocioConfig,
+                    args.customOcioConfig,
+                )
+                if job_management != color_management:
+                    nuke.scriptClear()
+                    graphs.clear()
+                    color_management = job_management
+                    _set_color_management(*color_management)
+
+                graph_key = (args.sourceColorspace, args.outputColorspace)
+                graph = graphs.get(graph_key)
+                if graph is None:
+                    graph = graphs[graph_key] = _create_graph(*graph_key)
+                _write_graph_thumbnail(
+                    graph,
+                    args.source,
+                    args.output,
+                    width=args.width,
+                    height=args.height,
+                    frame_mode=FrameMode(args.frameMode),
+                    custom_frame=args.customFrame,
+                )
+            except (Exception, SystemExit):
+                traceback.print_exc()
+
+                # Start the next job from a blank script
+                nuke.scriptClear()
+                graphs.clear()
+                color_management = None
+            finally:
+                print(ThumbWorker.DONE_MARKER, flush=True)
+
+
+def _create_graph(
+    source_colorspace: Optional[str] = None,
+    output_colorspace: Optional[str] = None,
+) -> Tuple[nuke.Node, nuke.Node, nuke.Node]:
+    """Create the Read, Reformat and Write nodes of a thumbnail
+
+    Returns:
+        Read, Reformat and Write nodes
+    """
+    read = nuke.nodes.Read(on_error="nearest frame")
+    if isinstance(source_colorspace, str):
+        read["colorspace"].setValue(source_colorspace)
+
+    reformat = nuke.nodes.Reformat(type="to box", box_fixed=True, resize="fit")
+    reformat.setInput(0, read)
+
+    write = nuke.nodes.Write(create_directories=True)
+    write.setInput(0, reformat)
+    if isinstance(output_colorspace, str):
+        write["colorspace"].setValue(output_colorspace)
+
+    return read, reformat, write
+
+
+def _write_graph_thumbnail(
+    graph: Tuple[nuke.Node, nuke.Node, nuke.Node],
+    source: str,
+    output: str,
+    width: int = 100,
+    height: int = 100,
+    frame_mode: FrameMode = FrameMode.MIDDLE,
+    custom_frame: int = 1,
+):
+    """Generate a thumbnail with nodes created by `_create_graph`"""
+    read, reformat, write = graph
+    file_knob = read["file"]
+    assert isinstance(file_knob, nuke.File_Knob)
+    file_knob.fromUserText(source)
+
+    w, h = _max_size(read.width(), read.height(), width, height)
+    frame = _calc_frame(read.firstFrame(), read.lastFrame(), frame_mode, custom_frame)
+    reformat["box_width"].setValue(w)
+    reformat["box_height"].setValue(h)
+    write["file"].setValue(output)
+
+    nuke.execute(write, frame, frame)
+
+
 def _write_node_thumbnail(
     node: nuke.Node,
     output: str,
@@ -386,6 +1052,7 @@ def _write_file_thumbnail(
         nuke.delete(read)
 
 
+@functools.lru_cache(maxsize=256)
 def _calc_frame(first: int, last: int, frame_mode: FrameMode, custom_frame: int) -> int:
     if frame_mode == FrameMode.CUSTOM:
         return custom_frame
@@ -398,6 +1065,7 @@ def _calc_frame(first: int, last: int, frame_mode: FrameMode, custom_frame: int)
             return first + int(float(last - first) / 2.0)
 
 
+@functools.lru_cache(maxsize=256)
 def _max_size(
     width: int, height: int, max_width: int, max_height: int
 ) -> Tuple[int, int]:
@@ -413,14 +1081,26 @@ def _max_size(
     Returns:
         Scaled bounds
     """
-    ratio = float(width) / float(height)
-    max_ratio = float(max_width) / float(max_height)
-    if max_ratio >= ratio:
-        return int(float(max_height) * ratio), max_height
+    # Formats without a size cannot be scaled
+    if width <= 0 or height <= 0:
+        return max_width, max_height
+
+    # Compare the ratios by cross-multiplying to stay in integers
+    if max_width * height >= width * max_height:
+        return max_height * width // height, max_height
     else:
-        return max_width, int(float(max_width) / ratio)
+        return max_width, max_width * height // width
 
 
+def invalidate_color_management():
+    """Forget the cached color management of the root node
+
+    Called whenever a script is loaded or a knob of the root node changes.
+    """
+    _get_color_management.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def _get_color_management() -> Tuple[str, str, str]:
     color_management = nuke.root()["colorManagement"].value()
     ocio_config = nuke.root()["OCIO_config"].value()
@@ -453,26 +1133,44 @@ def main():
     Examples:
         nuke -t this_module.py -width 200 -height 200 -source image.exr -output thumbnail.png
     """
-    import argparse
-
-    parser = argparse.ArgumentParser()
-    # Required
-    parser.add_argument("-source", type=str, required=True)
-    parser.add_argument("-output", type=str, required=True)
-    # Optional w Default
-    parser.add_argument("-width", type=int, default=100)
-    parser.add_argument("-height", type=int, default=100)
-    parser.add_argument("-frameMode", type=str, default="middle")
-    parser.add_argument("-customFrame", type=int, default=1)
-    # Optional
-    parser.add_argument("-sourceColorspace", type=str)
-    parser.add_argument("-outputColorspace", type=str)
-    parser.add_argument("-colorManagement", type=str)
-    parser.add_argument("-ocioConfig", type=str)
-    parser.add_argument("-customOcioConfig", type=str)
-    parser.add_argument("-writeScript", type=str)
-    args = parser.parse_args()
+    _generate(_parse_args())
+
+
+def _parse_args(argv: Optional[List[str]] = None):
+    """Parse the command line arguments of `main()`
+
+    Args:
+        argv:   Arguments to parse. None will use `sys.argv`.
+    """
+    # Arguments always come as '-name value' pairs. Argparse is slow to import
+    if argv is None:
+        argv = sys.argv[1:]
+    values = dict(zip(argv[0::2], argv[1::2]))
+
+    try:
+        return SimpleNamespace(
+            # Required
+            source=values["-source"],
+            output=values["-output"],
+            # Optional w Default
+            width=int(values.get("-width", 100)),
+            height=int(values.get("-height", 100)),
+            frameMode=values.get("-frameMode", "middle"),
+            customFrame=int(values.get("-customFrame", 1)),
+            # Optional
+            sourceColorspace=values.get("-sourceColorspace"),
+            outputColorspace=values.get("-outputColorspace"),
+            colorManagement=values.get("-colorManagement"),
+            ocioConfig=values.get("-ocioConfig"),
+            customOcioConfig=values.get("-customOcioConfig"),
+            writeScript=values.get("-writeScript"),
+        )
+    except KeyError as e:
+        raise ValueError(f"Missing argument: {e.args[0]}") from e
 
+
+def _generate(args):
+    """Generate a thumbnail from parsed command line arguments"""
     _set_color_management(args.colorManagement, args.ocioConfig, args.customOcioConfig)
     _write_file_thumbnail(
         args.source,
@@ -507,7 +1205,13 @@ def create_logger():
 
 
 if __name__ == "__main__":
-    main()
+    if "-worker" in sys.argv[1:]:
+        _worker_main()
+    else:
+        main()
 else:
     temp_cache = TempCache()
+    worker_pool = ThumbWorkerPool()
     logger = create_logger()
+    nuke.addOnScriptLoad(invalidate_color_management)
+    nuke.addKnobChanged(invalidate_color_management, nodeClass="Root")
@@ -1,9 +1,10 @@
-import math
+import functools
 import re
 from typing import List, Tuple, Optional
 
 
 # String ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
 def elide_middle(txt: str, width: int) -> str:
     """Shorten text to fit within a certain width
 
@@ -11,17 +12,24 @@ def elide_middle(txt: str, width: int) -> str:
 
     Args:
         txt:    Text to elide.
-        width:  Maximum character limit. Does not greedily fills empty space.
+        width:  Maximum character limit. Shorter text is padded to fill it.
     """
-    if len(txt) > width:
-        half = float(width) / 2
-        a, b = math.floor(half), math.ceil(half)
-        return txt[: a - 3] + " ... " + txt[len(txt) - b + 2 :]
+    size = len(txt)
+    if size > width:
+        a = width // 2
+        b = width - a
+        return txt[: a - 3] + " ... " + txt[size - b + 2 :]
     else:
         return txt.ljust(width)
 
 
 # Nuke sequence ---------------------------------------------------------------
+_RANGE_RE = re.compile(r"\s(\d+)-(\d+)$")
+# Frame range at the end of a nuke sequence. ex: ' 1-10'
+_PADDING_RE = re.compile(r"%0(\d)d|#{2,}")
+# Padding patterns. ex: '%04d' or '####'
+
+
 def format_as_nuke_sequence(padded_path: str, start: int, end: int) -> str:
     return f"{padded_path} {start}-{end}"
 
@@ -34,8 +42,7 @@ def strip_nuke_sequence(nuke_sequence: str) -> Tuple[str, Optional[int], Optiona
     Returns:
         Stripped path, first, last
     """
-    RE_RANGE = re.compile(r"\s(\d+)-(\d+)$")
-    m = RE_RANGE.search(nuke_sequence)
+    m = _RANGE_RE.search(nuke_sequence)
     if m:
         return nuke_sequence[: m.start(0)], int(m.group(1)), int(m.group(2))
     return nuke_sequence, None, None
@@ -51,35 +58,68 @@ def padded_set_frame(padded_path: str, frame: int) -> str:
         padded_path:    Filepath.
         frame:          Frame to replace the padding with.
     """
-    HASH_RE = re.compile(r"#{2,}")
-    STRF_RE = re.compile(r"%0(\d)d")
-    for pad_re in (STRF_RE, HASH_RE):
-        pad_m_list = reversed(list(pad_re.finditer(padded_path)))
-        if pad_m_list:
-            for pad_m in pad_m_list:
-                # Handle '####' and '%02d' format
-                try:
-                    size = int(pad_m.group(1))
-                except IndexError:
-                    size = len(pad_m.group(0))
-
-                # Replace only the last padding occurence
-                return (
-                    padded_path[: pad_m.start(0)]
-                    + str(frame).zfill(size)
-                    + padded_path[pad_m.end(0) :]
-                )
-    return padded_path
+    # Find the last occurence of each format in a single pass
+    strf_m, hash_m = None, None
+    for pad_m in _PADDING_RE.finditer(padded_path):
+        if pad_m.group(1) is None:
+            hash_m = pad_m
+        else:
+            strf_m = pad_m
+
+    # Handle '%02d' format first, then '####'
+    if strf_m is not None:
+        pad_m, size = strf_m, int(strf_m.group(1))
+    elif hash_m is not None:
+        pad_m, size = hash_m, len(hash_m.group(0))
+    else:
+        return padded_path
+
+    # Replace only the last padding occurence
+    return (
+        padded_path[: pad_m.start(0)]
+        + str(frame).zfill(size)
+        + padded_path[pad_m.end(0) :]
+    )
 
 
 # Format frame list -----------------------------------------------------------
+NUMPY_MIN_FRAMES = 64
+# Minimum amount of frames for numpy to be used by `basic_frames_formatting`.
+# Below it, converting the frames to an array costs more than it saves.
+
+
 def format_frames(frames: List[int], sep: str = ", ") -> str:
+    # Contiguous frames are a single range. Nuke is only needed for the others
+    if _frames_contiguous(frames):
+        return f"{frames[0]}-{frames[-1]}"
+
     try:
         return nuke_frames_formatting(frames, sep=sep)
     except ModuleNotFoundError:
         return basic_frames_formatting(frames, sep=sep)
 
 
+def _frames_contiguous(frames: List[int]) -> bool:
+    """Whether there are several frames, each one following the previous one
+
+    Args:
+        frames: List of frames.
+    """
+    if len(frames) < 2:
+        return False
+
+    if len(frames) >= NUMPY_MIN_FRAMES:
+        np = _import_numpy()
+        if np is not None:
+            diffs = np.diff(np.asarray(frames, dtype=np.int64))
+            return bool((diffs == 1).all())
+
+    for i in range(1, len(frames)):
+        if frames[i] - frames[i - 1] != 1:
+            return False
+    return True
+
+
 def basic_frames_formatting(frames: List[int], sep: str = " ") -> str:
     """Basic frame formatting that only compact sub-ranges. Not steps.
 
@@ -87,6 +127,12 @@ def basic_frames_formatting(frames: List[int], sep: str = " ") -> str:
         frames: List of frames.
         sep:    Separator to use between sub-ranges.
     """
+    # Long sequences are compacted by numpy when available
+    if len(frames) >= NUMPY_MIN_FRAMES:
+        np = _import_numpy()
+        if np is not None:
+            return _numpy_frames_formatting(np, frames, sep=sep)
+
     start, end, parts = None, None, []
 
     for f in frames:
@@ -111,6 +157,37 @@ def basic_frames_formatting(frames: List[int], sep: str = " ") -> str:
     return sep.join(parts)
 
 
+def _numpy_frames_formatting(np, frames: List[int], sep: str = " ") -> str:
+    """Vectorized `basic_frames_formatting`
+
+    Args:
+        np:     numpy module.
+        frames: List of frames. Must not be empty.
+        sep:    Separator to use between sub-ranges.
+    """
+    arr = np.asarray(frames, dtype=np.int64)
+
+    # Sub-ranges end wherever the next frame is not consecutive
+    breaks = np.flatnonzero(np.diff(arr) != 1)
+    starts = arr[np.r_[0, breaks + 1]].tolist()
+    ends = arr[np.r_[breaks, len(arr) - 1]].tolist()
+
+    return sep.join(
+        str(start) if start == end else f"{start}-{end}"
+        for start, end in zip(starts, ends)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _import_numpy():
+    """Return the numpy module, or None if it is not installed"""
+    try:
+        import numpy
+    except ModuleNotFoundError:
+        return None
+    return numpy
+
+
 def nuke_frames_formatting(frames: List[int], sep: str = " ") -> str:
     """Nuke's frame formatting
 
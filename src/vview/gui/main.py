@@ -1,5 +1,5 @@
-from pathlib import Path
-from typing import Any, Optional
+import os
+from typing import Any, Iterable, Optional
 
 from PySide2 import QtCore, QtGui
 
@@ -12,6 +12,10 @@ from .widgets import Pref, VersionDialog, VersionItemWidget
 
 
 class ConcreteVersionDialog(VersionDialog):
+    THUMB_DELAY = 50
+    # Milliseconds without scrolling before the visible thumbnails are generated.
+    # Avoids generating the thumbnails of every item passed during a fast scroll.
+
     version_changed = QtCore.Signal(object)  # (version)
 
     def __init__(
@@ -43,6 +47,8 @@ class ConcreteVersionDialog(VersionDialog):
 
         self._versions = []
         self._widgets = []
+        self._thumb_sources = []
+        self._thumb_pending = set()
 
         super().__init__(parent=parent)
 
@@ -54,29 +60,61 @@ class ConcreteVersionDialog(VersionDialog):
     def adjust_size(self) -> None:
         self.setFixedHeight(self.sizeHint().height())
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # The visible items are only known once the list is laid out
+        self._thumb_timer.start()
+
     # Version -----------------------------------------------------------------
     def add_version(self, version: Any) -> None:
-        widget = VersionItemWidget(
-            name=self.scanner.version_formatted_name(version),
-            path=self.scanner.version_formatted_path(version),
-            frames=self.scanner.version_formatted_frames(version),
-            date=self.scanner.version_formatted_date(version),
-            directory=str(Path(self.scanner.version_absolute_path(version)).parent),
-            thumb_enabled=self.header.preference_enabled(Pref.THUMBNAILS),
-            thumb_reformat=self.thumb_reformat,
-        )
-
-        if self.header.preference_enabled(Pref.THUMBNAILS):
-            self._generate_thumbnail(version, widget)
-
-        # Reverse the versions order since QListView cannot be visually reversed
-        self._versions.append(version)
-        self._widgets.append(widget)
-        self.list_widget.add_version_item(widget)
+        self.add_versions([version])
+
+    def add_versions(self, versions: Iterable[Any]) -> None:
+        """Add versions in order
+
+        Thumbnails are generated once their items are scrolled into view.
+        """
+        thumb_enabled = self.header.preference_enabled(Pref.THUMBNAILS)
+
+        widgets = []
+        for version in versions:
+            record = self.scanner.version_record(version)
+            absolute_path = record.absolute_path
+            widget = VersionItemWidget(
+                name=record.name,
+                path=record.path,
+                frames=record.frames,
+                date=record.date,
+                directory=os.path.dirname(absolute_path),
+                thumb_enabled=thumb_enabled,
+                thumb_reformat=self.thumb_reformat,
+            )
+
+            # Format as a nuke sequence. Kept for when thumbnails get enabled
+            thumb_source = absolute_path
+            frame_range = record.frame_range
+            if frame_range:
+                thumb_source = format_as_nuke_sequence(
+                    absolute_path, frame_range[0], frame_range[1]
+                )
+
+            # Reverse the versions order since QListView cannot be visually reversed
+            self._versions.append(version)
+            self._widgets.append(widget)
+            self._thumb_sources.append(thumb_source)
+            widgets.append(widget)
+
+        # Insert the items together. The dialog is resized once
+        self.list_widget.add_version_items(widgets)
+
+        if thumb_enabled:
+            self._thumb_timer.start()
 
     def clear_versions(self) -> None:
         self._versions.clear()
         self._widgets.clear()
+        self._thumb_sources.clear()
+        self._thumb_pending.clear()
 
         # Block the signals since its repeated during clear
         self.list_widget.setUpdatesEnabled(False)
@@ -93,6 +131,12 @@ class ConcreteVersionDialog(VersionDialog):
         self.adjust_size()
 
     def select_version(self, version: Any) -> None:
+        # Versions usually come from this dialog. Avoid comparing their content
+        for idx, _version in enumerate(self._versions):
+            if _version is version:
+                self.list_widget.set_selected_index(idx)
+                return
+
         for idx, _version in enumerate(self._versions):
             if _version == version:
                 self.list_widget.set_selected_index(idx)
@@ -107,46 +151,99 @@ class ConcreteVersionDialog(VersionDialog):
     # Private -----------------------------------------------------------------
     # Thumbnail ---------------------------------------------------------------
     def _on_thumb_enabled_changed(self, enabled: bool) -> None:
-        for version, widget in zip(self._versions, self._widgets):
-            if enabled:
-                self._generate_thumbnail(version, widget)
-
+        # Repaint the list once rather than once per widget
+        self.list_widget.setUpdatesEnabled(False)
+        for widget in self._widgets:
             widget.set_thumb_enabled(enabled)
+        self.list_widget.setUpdatesEnabled(True)
+
+        if enabled:
+            self._request_visible_thumbnails()
+
+    def _request_visible_thumbnails(self) -> None:
+        """Generate the missing thumbnails of the items inside the list viewport"""
+        if not self.header.preference_enabled(Pref.THUMBNAILS):
+            return
+
+        viewport_rect = self.list_widget.viewport().rect()
+        requests = []
+        for idx, (source, widget) in enumerate(zip(self._thumb_sources, self._widgets)):
+            item = self.list_widget.item(idx)
+            if item is None:
+                continue
+            if not self.list_widget.visualItemRect(item).intersects(viewport_rect):
+                continue
+
+            request = self._thumbnail_request(source, widget)
+            if request is not None:
+                requests.append(request)
+
+        # Launch sub-Processes together
+        if requests:
+            try:
+                self.thumb_cache.get_create_many(requests)
+            except Exception:
+                # Nothing will call back. Let them be requested again
+                for request in requests:
+                    self._thumb_pending.discard(request["callback_args"][0])
+                raise
 
-    def _generate_thumbnail(self, version: Any, widget: VersionItemWidget) -> None:
+    def _thumbnail_request(
+        self, source: str, widget: VersionItemWidget
+    ) -> Optional[dict]:
+        """Arguments of `IThumbCache.get_create` for a widget missing its thumbnail"""
         if self.thumb_compatible:
-            if widget.thumb_pixmap() is None:
-                # Format as a nuke sequence
-                path = self.scanner.version_absolute_path(version)
-                frame_range = self.scanner.version_frame_range(version)
-                if frame_range:
-                    path = format_as_nuke_sequence(path, frame_range[0], frame_range[1])
-
-                # Launch sub-Process
-                self.thumb_cache.get_create(
-                    source=path,
+            # Widgets already waiting on a thumbnail would receive it twice
+            if widget.thumb_pixmap() is None and widget not in self._thumb_pending:
+                self._thumb_pending.add(widget)
+                return dict(
+                    source=source,
                     source_colorspace=self.thumb_source_colorspace,
                     callback=self._on_thumb_generated,
                     callback_args=(widget,),
                 )
+        return None
 
     def _on_thumb_generated(self, output: str, widget: VersionItemWidget) -> None:
-        if Path(output).is_file():
-            pixmap = QtGui.QPixmap(output)
-            try:
-                widget.set_thumb_pixmap(pixmap)
+        self._thumb_pending.discard(widget)
+
+        # Thumbnail files never change once written. Share their decoded pixmap
+        pixmap = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(output, pixmap):
+            # Failed generations leave no file to load
+            if not pixmap.load(output):
+                return
+            QtGui.QPixmapCache.insert(output, pixmap)
 
-            # Object was deleted. Dialog must have been closed.
-            except RuntimeError:
-                pass
+        try:
+            widget.set_thumb_pixmap(pixmap)
+
+        # Object was deleted. Dialog must have been closed.
+        except RuntimeError:
+            pass
+
+    # UI ----------------------------------------------------------------------
+    def _init_ui(self):
+        super()._init_ui()
+        self._thumb_timer = QtCore.QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(self.THUMB_DELAY)
 
     # Connections -------------------------------------------------------------
     def _init_connects(self):
         super()._init_connects()
+        self._thumb_timer.timeout.connect(self._request_visible_thumbnails)
+        scroll_bar = self.list_widget.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_list_scrolled)
+        scroll_bar.rangeChanged.connect(self._on_list_scrolled)
         self.header.pref_changed.connect(self._on_pref_changed)
         self.list_widget.index_changed.connect(self._on_index_changed)
         self.list_widget.index_added.connect(self.adjust_size)
 
+    def _on_list_scrolled(self, *_args) -> None:
+        # Restarting the timer waits for the scrolling to settle
+        self._thumb_timer.start()
+
     def _on_pref_changed(self, pref: Pref, enabled: bool) -> None:
         if pref == Pref.THUMBNAILS:
             self._on_thumb_enabled_changed(enabled)
@@ -3,10 +3,10 @@ from PySide2 import QtGui
 
 
 def _load_stylesheet(css_file: Path) -> str:
-    if css_file.is_file():
-        with open(css_file) as f:
-            return f.read()
-    return ""
+    try:
+        return css_file.read_bytes().decode("utf-8")
+    except OSError:
+        return ""
 
 
 def install_fonts():
@@ -30,3 +30,8 @@ BASE_CSS = _load_stylesheet(CSS_DIR / "base.css")
 ITEM_CSS = _load_stylesheet(CSS_DIR / "item.css")
 LIST_CSS = _load_stylesheet(CSS_DIR / "list.css")
 HEADER_CSS = _load_stylesheet(CSS_DIR / "header.css")
+
+# Complete stylesheets of the widgets. Concatenated once instead of per instance
+ITEM_STYLESHEET = BASE_CSS + ITEM_CSS
+LIST_STYLESHEET = BASE_CSS + LIST_CSS
+HEADER_STYLESHEET = BASE_CSS + HEADER_CSS
@@ -3,7 +3,7 @@ from enum import Enum
 from PySide2 import QtCore, QtGui, QtWidgets
 
 import vview.gui.resources  # noqa
-from vview.gui.style import BASE_CSS, HEADER_CSS
+from vview.gui.style import HEADER_STYLESHEET
 
 
 class Pref(Enum):
@@ -50,7 +50,7 @@ class HeaderWidget(QtWidgets.QWidget):
     def _init_ui(self):
         sides_width = 140
 
-        self.setStyleSheet(BASE_CSS + HEADER_CSS)
+        self.setStyleSheet(HEADER_STYLESHEET)
         self.setMinimumHeight(26)
         self.setMaximumHeight(26)
 
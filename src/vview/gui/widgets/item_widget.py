@@ -170,7 +170,7 @@ class VersionItemWidget(QtWidgets.QWidget):
         self.thumbnail_QLabel.setPixmap(pixmap)
 
     def _init_ui(self):
-        self.setStyleSheet(vview.gui.style.BASE_CSS + vview.gui.style.ITEM_CSS)
+        self.setStyleSheet(vview.gui.style.ITEM_STYLESHEET)
         self.setProperty("selected", False)
 
         # Overall layout
@@ -59,12 +59,31 @@ class VersionListWidget(QtWidgets.QListWidget):
     # Items ------------------------------------------------------------------
     def add_version_item(self, widget: VersionItemWidget) -> QtWidgets.QListWidgetItem:
         """Add a pre-configured version item to the list"""
-        item = QtWidgets.QListWidgetItem()
-        self.addItem(item)
-        self.setItemWidget(item, widget)
-        self._update_item_size_hint(item)
+        return self.add_version_items([widget])[0]
+
+    def add_version_items(
+        self, widgets: List[VersionItemWidget]
+    ) -> List[QtWidgets.QListWidgetItem]:
+        """Add pre-configured version items to the list, in order
+
+        The list is repainted once and `index_added` is only emitted
+        for the last index.
+        """
+        if not widgets:
+            return []
+
+        self.setUpdatesEnabled(False)
+        items = []
+        for widget in widgets:
+            item = QtWidgets.QListWidgetItem()
+            self.addItem(item)
+            self.setItemWidget(item, widget)
+            self._update_item_size_hint(item)
+            items.append(item)
+        self.setUpdatesEnabled(True)
+
         self.index_added.emit(self.count() - 1)
-        return item
+        return items
 
     def idx_widget(self, idx: int) -> Optional[VersionItemWidget]:
         """Return the widget of an index"""
@@ -159,7 +178,7 @@ class VersionListWidget(QtWidgets.QListWidget):
 
     # Private ----------------------------------------------------------------
     def _init_ui(self):
-        self.setStyleSheet(vview.gui.style.BASE_CSS + vview.gui.style.LIST_CSS)
+        self.setStyleSheet(vview.gui.style.LIST_STYLESHEET)
         self.setSizePolicy(
             self.sizePolicy().horizontalPolicy(), QtWidgets.QSizePolicy.Fixed
         )
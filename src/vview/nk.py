@@ -138,18 +138,18 @@ class NodeVersionDialog(ConcreteVersionDialog):
             Nested versions are only scanned when required.
         """
         if not self._versions_computed:
-            for node_original_values in self._nodes_original_values:
-                file = node_original_values[MAIN_FILE_KNOB_NAME]
-                versions = self.scanner.scan_versions(file)
-                self._nodes_versions.append(versions)
+            files = [v[MAIN_FILE_KNOB_NAME] for v in self._nodes_original_values]
+            self._nodes_versions.extend(self.scanner.scan_versions_many(files))
             self._versions_computed = True
 
         if self.header.preference_enabled(Pref.NESTED_NODES):
             if not self._nested_versions_computed:
-                for node_original_values in self._nested_nodes_original_values:
-                    file = node_original_values[MAIN_FILE_KNOB_NAME]
-                    versions = self.scanner.scan_versions(file)
-                    self._nested_nodes_versions.append(versions)
+                files = [
+                    v[MAIN_FILE_KNOB_NAME] for v in self._nested_nodes_original_values
+                ]
+                self._nested_nodes_versions.extend(
+                    self.scanner.scan_versions_many(files)
+                )
                 self._nested_versions_computed = True
 
     def _find_display_node(self) -> Optional[nuke.Node]:
@@ -236,8 +236,7 @@ class NodeVersionDialog(ConcreteVersionDialog):
         self._config_thumb(display_node)
 
         # Populate
-        for version in reversed(display_versions):
-            self.add_version(version)
+        self.add_versions(reversed(display_versions))
 
         # Select
         if selected_version is not None:
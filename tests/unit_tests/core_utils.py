@@ -0,0 +1,81 @@
+import random
+import sys
+import unittest
+from unittest import mock
+
+from vview.core import utils
+from vview.core.utils import basic_frames_formatting, format_frames, padded_set_frame
+
+
+class TestFormatFrames(unittest.TestCase):
+    def setUp(self):
+        # Without nuke
+        patch = mock.patch.dict(sys.modules, {"nuke": None})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_contiguous(self):
+        self.assertEqual(format_frames([1, 2, 3]), "1-3")
+        self.assertEqual(format_frames(list(range(1, 101))), "1-100")
+
+    def test_steps(self):
+        self.assertEqual(format_frames([1, 3, 5]), "1, 3, 5")
+        self.assertEqual(format_frames([1, 2, 3, 7]), "1-3, 7")
+        self.assertEqual(format_frames([5]), "5")
+        self.assertEqual(format_frames([]), "")
+
+
+class TestBasicFramesFormatting(unittest.TestCase):
+    def test_sub_ranges(self):
+        self.assertEqual(basic_frames_formatting([]), "")
+        self.assertEqual(basic_frames_formatting([3]), "3")
+        self.assertEqual(basic_frames_formatting([1, 2, 3, 5, 7, 8]), "1-3 5 7-8")
+        self.assertEqual(basic_frames_formatting([1, 3, 5], sep=", "), "1, 3, 5")
+
+    def test_numpy_breakpoint(self):
+        # Either side of the breakpoint, numpy being installed or not
+        frames = list(range(1, utils.NUMPY_MIN_FRAMES)) + [100]
+        self.assertEqual(
+            basic_frames_formatting(frames), f"1-{utils.NUMPY_MIN_FRAMES - 1} 100"
+        )
+        frames = list(range(1, utils.NUMPY_MIN_FRAMES + 1)) + [100]
+        self.assertEqual(
+            basic_frames_formatting(frames), f"1-{utils.NUMPY_MIN_FRAMES} 100"
+        )
+
+    @unittest.skipIf(utils._import_numpy() is None, "numpy is not installed")
+    def test_numpy_fallback_equivalence(self):
+        # Mostly contiguous frames, with a few gaps
+        rng = random.Random(0)
+        for _ in range(50):
+            frames = [rng.randint(-50, 50)]
+            for _ in range(rng.randint(0, 300)):
+                frames.append(frames[-1] + (1 if rng.random() < 0.8 else 3))
+            numpy_result = utils._numpy_frames_formatting(
+                utils._import_numpy(), frames, sep=", "
+            )
+            with mock.patch.object(utils, "_import_numpy", return_value=None):
+                self.assertEqual(
+                    numpy_result, basic_frames_formatting(frames, sep=", ")
+                )
+
+
+class TestPaddedSetFrame(unittest.TestCase):
+    def test_formats(self):
+        self.assertEqual(padded_set_frame("name.####.jpg", 1), "name.0001.jpg")
+        self.assertEqual(padded_set_frame("name.%02d.jpg", 1), "name.01.jpg")
+        self.assertEqual(padded_set_frame("name.%04d.jpg", 12345), "name.12345.jpg")
+        self.assertEqual(padded_set_frame("name.#.jpg", 1), "name.#.jpg")
+        self.assertEqual(padded_set_frame("name.jpg", 1), "name.jpg")
+
+    def test_last_occurence(self):
+        self.assertEqual(padded_set_frame("##/name.###.jpg", 7), "##/name.007.jpg")
+        self.assertEqual(padded_set_frame("%02d/name.%03d.jpg", 7), "%02d/name.007.jpg")
+
+    def test_strf_first(self):
+        self.assertEqual(padded_set_frame("name.%02d.####.jpg", 7), "name.07.####.jpg")
+        self.assertEqual(padded_set_frame("name.####.%02d.jpg", 7), "name.####.07.jpg")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,16 @@
 from pathlib import Path
+import os
+import tempfile
 import unittest
+from unittest.mock import ANY, patch
 
 from vview.core.scanner.plugins.minimal.core import (
+    Version,
     scan_versions,
     re_match_versions,
     replace_re_match,
 )
+from vview.core.scanner.plugins.minimal.scanner import MinimalVersionScanner
 
 
 class TestPadding(unittest.TestCase):
@@ -16,40 +21,44 @@ class TestPadding(unittest.TestCase):
         root = self.root / "padding" / "none"
 
         p = str(root / "name.jpg")
-        self.assertEqual(scan_versions(p), [(p, None, [])])
+        self.assertEqual(scan_versions(p), [Version(p, None, [], ANY)])
 
         p = str(root / "v1_name.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", [], ANY)])
 
     def test_hash_frames(self):
         root = self.root / "padding" / "frames"
 
         p = str(root / "v1_##.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["01", "02", "10", "21"])])
+        self.assertEqual(
+            scan_versions(p), [Version(p, "v1", ["01", "02", "10", "21"], ANY)]
+        )
 
     def test_strf_frames(self):
         root = self.root / "padding" / "frames"
 
         p = str(root / "v1_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["01", "02", "10", "21"])])
+        self.assertEqual(
+            scan_versions(p), [Version(p, "v1", ["01", "02", "10", "21"], ANY)]
+        )
 
     def test_hash_padding_amount(self):
         root = self.root / "padding" / "amount"
 
         p = str(root / "v1_##.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["01"], ANY)])
 
         p = str(root / "v1_01_##.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["02"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["02"], ANY)])
 
         p = str(root / "v1_01_02_##.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["03"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["03"], ANY)])
 
         p = str(root / "v1_03_03_##.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["03"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["03"], ANY)])
 
         p = str(root / "v1_##_03_03.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["03"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["03"], ANY)])
 
         p = str(root / "v1_##_##_##.jpg")
         self.assertEqual(scan_versions(p), [])
@@ -58,19 +67,19 @@ class TestPadding(unittest.TestCase):
         root = self.root / "padding" / "amount"
 
         p = str(root / "v1_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["01"], ANY)])
 
         p = str(root / "v1_01_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["02"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["02"], ANY)])
 
         p = str(root / "v1_01_02_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["03"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["03"], ANY)])
 
         p = str(root / "v1_03_03_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["03"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["03"], ANY)])
 
         p = str(root / "v1_%02d_03_03.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["03"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["03"], ANY)])
 
         p = str(root / "v1_%02d_%02d_%02d.jpg")
         self.assertEqual(scan_versions(p), [])
@@ -82,52 +91,59 @@ class TestPadding(unittest.TestCase):
         self.assertEqual(scan_versions(p), [])
 
         p = str(root / "v1_##.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["01"], ANY)])
 
         p = str(root / "v1_###.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["001"], ANY)])
 
         p = str(root / "v1_####.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["0001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["0001"], ANY)])
 
         p = str(root / "v1_#####.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["00001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["00001"], ANY)])
 
         p = str(root / "v1_######.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["000001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["000001"], ANY)])
 
         p = str(root / "v1_#######.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["0000001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["0000001"], ANY)])
 
         p = str(root / "v1_########.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["00000001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["00000001"], ANY)])
+
+    def test_mtime(self):
+        root = self.root / "padding" / "frames"
+
+        p = str(root / "v1_##.jpg")
+        version = scan_versions(p)[0]
+        self.assertEqual(version.mtime, (root / "v1_21.jpg").stat().st_mtime)
 
     def test_strf_size(self):
         root = self.root / "padding" / "size"
 
         p = str(root / "v1_%01d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["1"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["1"], ANY)])
 
         p = str(root / "v1_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["01"], ANY)])
 
         p = str(root / "v1_%03d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["001"], ANY)])
 
         p = str(root / "v1_%04d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["0001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["0001"], ANY)])
 
         p = str(root / "v1_%05d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["00001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["00001"], ANY)])
 
         p = str(root / "v1_%06d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["000001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["000001"], ANY)])
 
         p = str(root / "v1_%07d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["0000001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["0000001"], ANY)])
 
         p = str(root / "v1_%08d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", ["00000001"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", ["00000001"], ANY)])
 
 
 class TestVersion(unittest.TestCase):
@@ -138,22 +154,22 @@ class TestVersion(unittest.TestCase):
         root = self.root / "amount"
 
         p = str(root / "v01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", [], ANY)])
 
         p = str(root / "v01_v01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", [], ANY)])
 
         p = str(root / "v01_v01_v01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", [], ANY)])
 
     def test_case(self):
         root = self.root / "case"
 
         p = str(root / "v1_01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", [], ANY)])
 
         p = str(root / "V1_01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "V1", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "V1", [], ANY)])
 
     def test_list(self):
         root = self.root / "list"
@@ -162,12 +178,12 @@ class TestVersion(unittest.TestCase):
         self.assertEqual(
             scan_versions(p),
             [
-                (p, "v01", []),
-                (str(root / "v02_01.jpg"), "v02", []),
-                (str(root / "v03_01.jpg"), "v03", []),
-                (str(root / "v05_01.jpg"), "v05", []),
-                (str(root / "v11_01.jpg"), "v11", []),
-                (str(root / "v20_01.jpg"), "v20", []),
+                Version(p, "v01", [], ANY),
+                Version(str(root / "v02_01.jpg"), "v02", [], ANY),
+                Version(str(root / "v03_01.jpg"), "v03", [], ANY),
+                Version(str(root / "v05_01.jpg"), "v05", [], ANY),
+                Version(str(root / "v11_01.jpg"), "v11", [], ANY),
+                Version(str(root / "v20_01.jpg"), "v20", [], ANY),
             ],
         )
 
@@ -175,40 +191,40 @@ class TestVersion(unittest.TestCase):
         root = self.root / "none"
 
         p = str(root / "name.jpg")
-        self.assertEqual(scan_versions(p), [(p, None, [])])
+        self.assertEqual(scan_versions(p), [Version(p, None, [], ANY)])
 
         p = str(root / "name_01.jpg")
-        self.assertEqual(scan_versions(p), [(p, None, [])])
+        self.assertEqual(scan_versions(p), [Version(p, None, [], ANY)])
 
     def test_order(self):
         root = self.root / "order"
 
         p = str(root / "v01_v01_v01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", [], ANY)])
 
         p = str(root / "v01_v02_v03.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v03", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v03", [], ANY)])
 
     def test_size(self):
         root = self.root / "size"
 
         p = str(root / "v1.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v1", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v1", [], ANY)])
 
         p = str(root / "v01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", [], ANY)])
 
         p = str(root / "v001.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v001", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v001", [], ANY)])
 
         p = str(root / "v0001.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v0001", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v0001", [], ANY)])
 
         p = str(root / "v00001.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v00001", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v00001", [], ANY)])
 
         p = str(root / "v000001.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v000001", [])])
+        self.assertEqual(scan_versions(p), [Version(p, "v000001", [], ANY)])
 
     def test_replace(self):
         root = self.root / "replace"
@@ -257,34 +273,232 @@ class TestMixed(unittest.TestCase):
         root = self.root / "none"
 
         p = str(root / "name.jpg")
-        self.assertEqual(scan_versions(p), [(p, None, [])])
+        self.assertEqual(scan_versions(p), [Version(p, None, [], ANY)])
 
     def test_order(self):
         root = self.root / "order"
 
         p = str(root / "%02d_v01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", ["01"], ANY)])
 
         p = str(root / "01_v01_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", ["01"], ANY)])
 
         p = str(root / "%02d_v01_01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", ["01"], ANY)])
 
         p = str(root / "v01_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", ["01"], ANY)])
 
         p = str(root / "v01_%02d_v01.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", ["01"], ANY)])
 
     def test_relative_path(self):
         root = self.root / "order"
 
         p = str(Path("tests") / "unit_tests/samples/mixed/order/v01_%02d.jpg")
-        self.assertEqual(scan_versions(p), [(p, "v01", ["01"])])
+        self.assertEqual(scan_versions(p), [Version(p, "v01", ["01"], ANY)])
 
         p = "v01_%02d.jpg"
-        self.assertEqual(scan_versions(p, root_dir=str(root)), [(p, "v01", ["01"])])
+        self.assertEqual(
+            scan_versions(p, root_dir=str(root)), [Version(p, "v01", ["01"], ANY)]
+        )
+
+        p = str(Path("order") / "v01_%02d.jpg")
+        self.assertEqual(
+            scan_versions(p, root_dir=str(self.root)), [Version(p, "v01", ["01"], ANY)]
+        )
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for file in ("v01/a_v01.01.jpg", "v01/a_v01.02.jpg", "v02/a_v02.01.jpg"):
+                (root / file).parent.mkdir(exist_ok=True)
+                (root / file).touch()
+            (root / "v03").touch()
+
+            p = str(Path("v01") / "a_v01.##.jpg")
+            self.assertEqual(
+                scan_versions(p, root_dir=tmp),
+                [
+                    Version(p, "v01", ["01", "02"], ANY),
+                    Version(str(Path("v02") / "a_v02.##.jpg"), "v02", ["01"], ANY),
+                ],
+            )
+
+    def test_trailing_separator(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for directory in ("v01", "v02", "plain"):
+                (root / directory).mkdir()
+            (root / "v03").touch()
+            (root / "file").touch()
+
+            # Only directories match
+            p = "v01" + os.sep
+            self.assertEqual(
+                scan_versions(p, root_dir=tmp),
+                [Version(p, "v01", [], ANY), Version("v02" + os.sep, "v02", [], ANY)],
+            )
+
+            p = "plain" + os.sep
+            self.assertEqual(
+                scan_versions(p, root_dir=tmp), [Version(p, None, [], ANY)]
+            )
+
+            p = "file" + os.sep
+            self.assertEqual(scan_versions(p, root_dir=tmp), [])
+
+
+class TestScanner(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(__file__).parent / "samples"
+
+    def test_scan_versions_many(self):
+        scanner = MinimalVersionScanner()
+
+        paths = [
+            str(self.root / "version" / "list" / "v01_01.jpg"),
+            str(self.root / "padding" / "frames" / "v1_##.jpg"),
+            str(self.root / "version" / "list" / "v01_01.jpg"),
+            "",
+        ]
+        self.assertEqual(
+            scanner.scan_versions_many(paths),
+            [scanner.scan_versions(p) for p in paths],
+        )
+
+    def test_version_absolute_path(self):
+        root = self.root / "padding"
+        scanner = MinimalVersionScanner(root_dir=str(root))
+
+        version = scanner.scan_versions(str(Path("frames") / "v1_##.jpg"))[0]
+        self.assertEqual(
+            scanner.version_absolute_path(version),
+            str((root / "frames" / "v1_##.jpg").absolute()),
+        )
+
+    def test_path_replace_version_name(self):
+        scanner = MinimalVersionScanner()
+
+        p = "name_v001.png"
+        self.assertEqual(scanner.path_replace_version_name(p, "v003"), "name_v003.png")
+
+        p = str(Path("v001") / "name_v001_####.png")
+        self.assertEqual(
+            scanner.path_replace_version_name(p, "v003"),
+            str(Path("v003") / "name_v003_####.png"),
+        )
+
+        p = "name.png"
+        self.assertEqual(scanner.path_replace_version_name(p, "v003"), p)
+
+    def test_version_frames(self):
+        scanner = MinimalVersionScanner()
+
+        version = scanner.scan_versions(str(self.root / "padding/frames/v1_##.jpg"))[0]
+        self.assertEqual(version.int_frames, [1, 2, 10, 21])
+        self.assertEqual(scanner.version_frame_range(version), (1, 21))
+        self.assertEqual(scanner.version_formatted_frames(version), "1-2, 10, 21")
+        self.assertEqual(version.to_tuple()[1:3], ("v1", ["01", "02", "10", "21"]))
+
+    def test_version_record(self):
+        scanner = MinimalVersionScanner()
+
+        version = scanner.scan_versions(str(self.root / "padding/frames/v1_##.jpg"))[0]
+        record = scanner.version_record(version)
+        self.assertEqual(record.name, scanner.version_formatted_name(version))
+        self.assertEqual(record.path, scanner.version_formatted_path(version))
+        self.assertEqual(record.frames, "1-2, 10, 21")
+        self.assertEqual(record.date, scanner.version_formatted_date(version))
+        self.assertEqual(record.absolute_path, scanner.version_absolute_path(version))
+        self.assertEqual(record.raw_path, scanner.version_raw_path(version))
+        self.assertEqual(record.frame_range, (1, 21))
+
+    def test_string_patterns(self):
+        scanner = MinimalVersionScanner(
+            version_patterns=[r"[vV](\d+)"], padding_patterns=[r"#{2,}"]
+        )
+        self.assertIsInstance(scanner.version_patterns, tuple)
+
+        p = str(self.root / "padding/frames/v1_##.jpg")
+        self.assertEqual(
+            scanner.scan_versions(p), MinimalVersionScanner().scan_versions(p)
+        )
+
+    def test_scan_cache(self):
+        scanner = MinimalVersionScanner()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "v01.jpg").touch()
+            p = str(root / "v01.jpg")
+            self.assertEqual(len(scanner.scan_versions(p)), 1)
+            self.assertEqual(len(scanner._scan_cache), 1)
+
+            # Adding a file bumps the directory mtime (forced past its granularity)
+            (root / "v02.jpg").touch()
+            mtime_ns = os.stat(tmp).st_mtime_ns + 1
+            os.utime(tmp, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(len(scanner.scan_versions(p)), 2)
+
+            # Changes that keep the directory mtime
+            (root / "v03.jpg").touch()
+            os.utime(tmp, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(len(scanner.scan_versions(p)), 2)
+            scanner.clear_scan_cache()
+            self.assertEqual(len(scanner.scan_versions(p)), 3)
+
+    def test_scan_cache_copies(self):
+        scanner = MinimalVersionScanner()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for frame in (1, 2):
+                (root / f"v01.{frame:04d}.jpg").touch()
+            p = str(root / "v01.####.jpg")
+
+            # Changes to returned versions never reach the next scans
+            for _ in range(2):
+                (version,) = scanner.scan_versions(p)
+                self.assertEqual(version.frames, ["0001", "0002"])
+                self.assertEqual(version.formatted_frames, "1-2")
+                version.frames.append("0003")
+                version.int_frames.append(3)
+                version.padded_path = "other"
+            self.assertEqual(scanner.scan_versions(p)[0].int_frames, [1, 2])
+
+    def test_scan_cache_ttl(self):
+        scanner = MinimalVersionScanner()
+
+        with tempfile.TemporaryDirectory() as tmp, patch.object(
+            MinimalVersionScanner, "SCAN_CACHE_TTL", -1.0
+        ):
+            root = Path(tmp)
+            (root / "v01.jpg").touch()
+            p = str(root / "v01.jpg")
+            self.assertEqual(len(scanner.scan_versions(p)), 1)
+
+            mtime_ns = os.stat(tmp).st_mtime_ns
+            (root / "v02.jpg").touch()
+            os.utime(tmp, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(len(scanner.scan_versions(p)), 2)
+
+    def test_scan_cache_relative(self):
+        scanner = MinimalVersionScanner()
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+
+        with tempfile.TemporaryDirectory() as tmp_a:
+            with tempfile.TemporaryDirectory() as tmp_b:
+                (Path(tmp_a) / "v01.jpg").touch()
+                (Path(tmp_b) / "v01.jpg").touch()
+                (Path(tmp_b) / "v02.jpg").touch()
+
+                os.chdir(tmp_a)
+                self.assertEqual(len(scanner.scan_versions("v01.jpg")), 1)
+                os.chdir(tmp_b)
+                self.assertEqual(len(scanner.scan_versions("v01.jpg")), 2)
 
 
 if __name__ == "__main__":
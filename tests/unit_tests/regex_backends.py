@@ -0,0 +1,70 @@
+from pathlib import Path
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+UNIT_TESTS_DIR = Path(__file__).parent
+SRC_DIR = UNIT_TESTS_DIR.parent.parent / "src"
+HAS_RE2 = importlib.util.find_spec("re2") is not None
+
+
+def _run_python(args, no_re2: bool) -> subprocess.CompletedProcess:
+    """Run python with the regex backend of the scanner forced"""
+    env = dict(os.environ)
+    paths = [str(SRC_DIR), str(UNIT_TESTS_DIR)]
+    if env.get("PYTHONPATH"):
+        paths.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    env.pop("VVIEW_NO_RE2", None)
+    if no_re2:
+        env["VVIEW_NO_RE2"] = "1"
+
+    return subprocess.run(
+        [sys.executable] + args,
+        env=env,
+        cwd=str(UNIT_TESTS_DIR.parent.parent),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+
+
+def _backend(no_re2: bool) -> str:
+    """Return the name of the regex module used by the scanner"""
+    code = (
+        "from vview.core.scanner.plugins.minimal import core; "
+        "print(core._re.__name__)"
+    )
+    return _run_python(["-c", code], no_re2).stdout.strip()
+
+
+class TestRegexBackends(unittest.TestCase):
+    def test_no_re2(self):
+        self.assertEqual(_backend(no_re2=True), "re")
+
+        p = _run_python(["-m", "unittest", "minimal_scan"], no_re2=True)
+        self.assertEqual(p.returncode, 0, p.stdout)
+
+    @unittest.skipUnless(HAS_RE2, "re2 is not installed")
+    def test_re2(self):
+        self.assertEqual(_backend(no_re2=False), "re2")
+
+        p = _run_python(["-m", "unittest", "minimal_scan"], no_re2=False)
+        self.assertEqual(p.returncode, 0, p.stdout)
+
+    @unittest.skipUnless(HAS_RE2, "re2 is not installed")
+    def test_re2_api(self):
+        import re2
+
+        # Used by the scanner on the default patterns
+        pattern = re2.compile(r"#{2,}")
+        self.assertEqual(hash(pattern), hash(pattern))
+        self.assertEqual([m.start(0) for m in pattern.finditer("##_##", 1)], [3])
+        with self.assertRaises(IndexError):
+            pattern.search("##").group(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
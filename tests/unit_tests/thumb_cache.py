@@ -0,0 +1,351 @@
+from pathlib import Path
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from vview.core.thumb.base import FrameMode
+
+# The cache only talks to nuke to dispatch on its main thread.
+# Other modules must keep finding nuke missing.
+with mock.patch.dict(sys.modules, {"nuke": mock.MagicMock()}):
+    from vview.core.thumb import nk
+
+
+def _execute_now(callback, args=(), kwargs=None):
+    callback(*args, **(kwargs or {}))
+
+
+class TestTempCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+        patches = [
+            mock.patch.object(nk.TempCache, "ROOT_DIR", self.root),
+            mock.patch.object(nk.TempCache, "LOCK_POLL_INTERVAL", 0.01),
+            mock.patch.object(nk, "_get_color_management", return_value=("", "", "")),
+            mock.patch.object(nk.nuke, "executeInMainThread", _execute_now),
+            mock.patch.object(nk.ThumbProcess, "run"),
+            mock.patch.object(nk.ThumbProcess, "run_many"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.cache = nk.TempCache()
+
+    def _touch(self, path: str, age: float = 0.0):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Path(path).touch()
+        if age:
+            mtime = time.time() - age
+            os.utime(path, (mtime, mtime))
+
+    def _finish(self, key: tuple):
+        self.cache._generated(self.cache._format_filepath(str(key)), key)
+
+    def test_lru_keeps_pending(self):
+        self.cache.set_max_size(2)
+        for source in ("a.exr", "b.exr", "c.exr"):
+            self.cache.get_create(source)
+        keys = list(self.cache._cache)
+        self.assertEqual(len(keys), 3)
+
+        # Only finished thumbnails are forgotten
+        for key in keys:
+            self._finish(key)
+        self.assertEqual(list(self.cache._cache), keys[1:])
+
+        # Least recently used first
+        self.cache.get_create("b.exr")
+        self.cache.set_max_size(1)
+        self.assertEqual(list(self.cache._cache), [keys[1]])
+
+    def test_disk_index_ttl(self):
+        output = self.cache._format_filepath("key")
+        self._touch(output)
+        self.assertTrue(self.cache._disk_has(output))
+
+        # The listing is trusted until it expires
+        os.remove(output)
+        self.assertTrue(self.cache._disk_has(output))
+        with mock.patch.object(nk.TempCache, "DISK_INDEX_TTL", -1.0):
+            self.assertFalse(self.cache._disk_has(output))
+
+        # Or a thumbnail is written in its directory
+        self._touch(output)
+        key = self.cache._canon_key("a.exr", 100, 100, FrameMode.MIDDLE, 1, None, None)
+        self.cache._process_finished(output, key)
+        self.assertTrue(self.cache._disk_has(output))
+
+    def test_canon_key(self):
+        canon_key = self.cache._canon_key
+        self.assertEqual(
+            canon_key("a.exr", 100, 100, FrameMode.MIDDLE, 1, "", None),
+            canon_key("a.exr", 100, 100, FrameMode.MIDDLE, 5, None, ""),
+        )
+        self.assertNotEqual(
+            canon_key("a.exr", 100, 100, FrameMode.CUSTOM, 1, None, None),
+            canon_key("a.exr", 100, 100, FrameMode.CUSTOM, 5, None, None),
+        )
+
+    def test_equivalent_requests(self):
+        outputs = []
+        self.cache.get_create("a.exr", custom_frame=1, callback=outputs.append)
+        self.cache.get_create(
+            "a.exr", custom_frame=5, source_colorspace="", callback=outputs.append
+        )
+        nk.ThumbProcess.run.assert_called_once()
+
+        (key,) = self.cache._cache
+        self._finish(key)
+        self.assertEqual(outputs, [self.cache._format_filepath(str(key))] * 2)
+
+    def test_forget_custom_frames(self):
+        outputs = []
+        request = dict(
+            frame_mode=FrameMode.CUSTOM, custom_frame=3, callback=outputs.append
+        )
+        self.cache.get_create("a.exr", **request)
+        (key,) = self.cache._cache
+        output = self.cache._format_filepath(str(key))
+        self._touch(output)
+        self._finish(key)
+        self.assertEqual(outputs, [output])
+        self.assertEqual(len(self.cache._cache), 0)
+
+        # Requested again, it is found on disk and remembered
+        self.cache.get_create("a.exr", **request)
+        self.assertEqual(outputs, [output, output])
+        self.assertEqual(list(self.cache._cache), [key])
+        nk.ThumbProcess.run.assert_called_once()
+
+    def test_ready_requires_released_lock(self):
+        output = self.cache._format_filepath("key")
+        self._touch(output)
+        self._touch(output + ".lock")
+        self.assertFalse(self.cache._disk_ready(output))
+
+        os.remove(output + ".lock")
+        self.cache._disk_index.clear()
+        self.assertTrue(self.cache._disk_ready(output))
+
+    def test_legacy_lookup(self):
+        outputs = []
+        legacy_output = self.cache._format_legacy_filepath(
+            str(("a.exr", 100, 100, FrameMode.MIDDLE, 1, None, None))
+        )
+        self._touch(legacy_output)
+
+        self.cache.get_create("a.exr", callback=outputs.append)
+        self.assertEqual(outputs, [legacy_output])
+
+    def test_no_legacy_lookup(self):
+        self._touch(self.cache._format_filepath("key"))
+
+        with mock.patch.object(nk.TempCache, "_format_legacy_filepath") as legacy:
+            self.cache.get_create("a.exr")
+            self.cache.get_create("b.exr")
+        legacy.assert_not_called()
+
+    def test_relaunch_keeps_watching(self):
+        output = self.cache._format_filepath("key")
+        lock = output + ".lock"
+        self._touch(lock, age=self.cache.LOCK_TIMEOUT + 1)
+
+        # Another session takes the abandoned lock before it is relaunched here
+        relaunched = threading.Event()
+
+        def execute(callback, args=(), kwargs=None):
+            self._touch(lock)
+            callback(*args, **(kwargs or {}))
+            relaunched.set()
+
+        self.addCleanup(self.cache._watched.clear)
+        with mock.patch.object(nk.nuke, "executeInMainThread", execute):
+            self.cache._watch(output, mock.MagicMock(), ("key",))
+            self.assertTrue(relaunched.wait(5))
+            time.sleep(self.cache.LOCK_POLL_INTERVAL * 5)
+            with self.cache._watch_lock:
+                self.assertIn(output, self.cache._watched)
+
+
+class TestTempCacheGeneration(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+        # Jobs run right away in a worker that only writes the output files
+        thread_pool = mock.MagicMock()
+        thread_pool.submit.side_effect = lambda fn, *args: fn(*args)
+        worker = mock.MagicMock()
+        worker.run_many = self._run_many
+        worker_pool = mock.MagicMock()
+        worker_pool.acquire.return_value = worker
+
+        patches = [
+            mock.patch.object(nk.TempCache, "ROOT_DIR", self.root),
+            mock.patch.object(nk, "_get_color_management", return_value=("", "", "")),
+            mock.patch.object(nk.nuke, "executeInMainThread", _execute_now),
+            mock.patch.object(nk, "thread_pool", thread_pool),
+            mock.patch.object(nk, "worker_pool", worker_pool),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.cache = nk.TempCache()
+
+    @staticmethod
+    def _run_many(argvs):
+        for argv in argvs:
+            Path(dict(zip(argv[0::2], argv[1::2]))["-output"]).touch()
+            yield ""
+
+    def _assert_finished(self, outputs, sources):
+        expected = [
+            self.cache._format_filepath(
+                str(self.cache._canon_key(s, 100, 100, FrameMode.MIDDLE, 1, None, None))
+            )
+            for s in sources
+        ]
+        self.assertEqual(sorted(outputs), sorted(expected))
+        for output in self.cache._cache.values():
+            self.assertNotIsInstance(output, nk._Pending)
+        self.assertEqual(list(self.root.glob("*/*.lock")), [])
+
+    def test_get_create(self):
+        outputs = []
+        self.cache.get_create("a.exr", callback=outputs.append)
+        self._assert_finished(outputs, ["a.exr"])
+
+    def test_get_create_many(self):
+        outputs = []
+        sources = ["a.exr", "b.exr", "c.exr"]
+        self.cache.get_create_many(
+            [dict(source=s, callback=outputs.append) for s in sources]
+        )
+        self._assert_finished(outputs, sources)
+
+    def test_get_create_many_callback_args(self):
+        # Requests as made by the version dialog, one per item widget
+        received = []
+        widgets = [object(), object()]
+        self.cache.get_create_many(
+            [
+                dict(
+                    source=f"{i}.exr",
+                    source_colorspace="",
+                    callback=lambda output, w: received.append((w, output)),
+                    callback_args=(widget,),
+                )
+                for i, widget in enumerate(widgets)
+            ]
+        )
+        self.assertEqual(sorted(map(id, dict(received))), sorted(map(id, widgets)))
+        for _widget, output in received:
+            self.assertTrue(os.path.isfile(output))
+
+    def test_failed_generation_calls_back(self):
+        def run_many(argvs):
+            raise RuntimeError("broken worker")
+
+        outputs = []
+        nk.worker_pool.acquire.return_value.run_many = run_many
+        with mock.patch.object(
+            nk.subprocess, "run", side_effect=FileNotFoundError("nuke")
+        ), mock.patch.object(nk.ThumbProcess, "log"):
+            self.cache.get_create_many([dict(source="a.exr", callback=outputs.append)])
+
+        # The missing file is the only sign of the failure for the dialog
+        self._assert_finished(outputs, ["a.exr"])
+        self.assertFalse(os.path.isfile(outputs[0]))
+
+
+class TestMaxWorkers(unittest.TestCase):
+    def test_valid_max_workers(self):
+        self.assertEqual(nk._valid_max_workers("2"), 2)
+        self.assertEqual(nk._valid_max_workers("0"), 1)
+        self.assertEqual(nk._valid_max_workers(-3), 1)
+        self.assertEqual(nk._valid_max_workers("four"), nk.DEFAULT_MAX_WORKERS)
+        self.assertEqual(nk._valid_max_workers(None), nk.DEFAULT_MAX_WORKERS)
+
+    def test_set_max_workers(self):
+        self.addCleanup(nk.set_max_workers, nk.MAX_WORKERS)
+        nk.set_max_workers(0)
+        self.assertEqual(nk.thread_pool._max_workers, 1)
+
+
+class TestThumbWorkerPool(unittest.TestCase):
+    def setUp(self):
+        patch = mock.patch.object(nk, "ThumbWorker")
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.pool = nk.ThumbWorkerPool()
+
+    def test_reuse(self):
+        worker = self.pool.acquire()
+        self.pool.release(worker)
+        self.assertIs(self.pool.acquire(), worker)
+        worker.close.assert_not_called()
+
+    def test_idle_timeout(self):
+        with mock.patch.object(nk.ThumbWorkerPool, "IDLE_TIMEOUT", 0.05):
+            worker = mock.MagicMock()
+            self.pool.release(worker)
+            self.pool._reaper.join(5)
+
+        worker.close.assert_called_once()
+        self.assertIsNot(self.pool.acquire(), worker)
+
+
+class TestThumbProcess(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.object(nk.nuke, "executeInMainThread", _execute_now),
+            mock.patch.object(nk.ThumbProcess, "log"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.outputs = []
+        self.jobs = [
+            (["nuke", "-t", "nk.py"], self.outputs.append, output, (), {})
+            for output in ("a.png", "b.png", "c.png")
+        ]
+
+    def test_worker_failure_finishes_all_jobs(self):
+        def run_many(argvs):
+            yield "logs"
+            raise RuntimeError("broken worker")
+
+        worker = mock.MagicMock()
+        worker.run_many = run_many
+        with mock.patch.object(nk, "worker_pool") as worker_pool:
+            worker_pool.acquire.return_value = worker
+            nk.ThumbProcess._run_many_in_thread(self.jobs)
+
+        self.assertEqual(self.outputs, ["a.png", "b.png", "c.png"])
+        worker.close.assert_called_once()
+        worker_pool.release.assert_not_called()
+        self.assertIn("broken worker", nk.ThumbProcess.log.call_args[0][1])
+
+    def test_fallback_failure_finishes_all_jobs(self):
+        with mock.patch.object(nk, "worker_pool") as worker_pool, mock.patch.object(
+            nk.subprocess, "run", side_effect=FileNotFoundError("nuke")
+        ):
+            worker_pool.acquire.side_effect = OSError("no worker")
+            nk.ThumbProcess._run_many_in_thread(self.jobs)
+
+        self.assertEqual(self.outputs, ["a.png", "b.png", "c.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()